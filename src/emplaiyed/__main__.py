@@ -0,0 +1,48 @@
+"""Console entry point — ``emplaiyed`` and ``python -m emplaiyed``.
+
+``--version`` is answered here before the Typer app (and every command
+module) is imported; everything else is handed to ``emplaiyed.main.app``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+
+def main() -> None:
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from importlib.metadata import version as pkg_version
+
+        print(f"emplaiyed {pkg_version('emplaiyed')}")
+        return
+
+    # pydantic discovers installed plugins when the first model class is
+    # built; logfire's (pulled in by pydantic-ai) costs ~200 ms to import
+    # and is inert unless logfire is configured, which we never do.
+    os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "logfire-plugin")
+
+    _use_uvloop()
+
+    from emplaiyed.main import app
+
+    app()
+
+
+def _use_uvloop() -> None:
+    """Run ``asyncio.run`` on uvloop when it is installed.
+
+    It comes with ``fastapi[standard]`` (via uvicorn) everywhere but
+    Windows; scraping, scoring and generation are all network-bound.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Lazy attribute loading for package ``__init__`` re-exports."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_getattr(package: str, mapping: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` resolving *mapping* names on first access.
+
+    Each public name is imported from its submodule only when first looked
+    up, then cached on the package so later lookups skip the hook.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = mapping[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -14,6 +14,7 @@ from fastapi.responses import HTMLResponse
 
 from emplaiyed.core.database import (
     get_application,
+    list_all_status_transitions,
     list_applications,
     list_applications_by_statuses,
     list_pending_work_items,
@@ -94,9 +95,7 @@ async def dashboard(
     apps = list_applications(conn)
 
     # Gather all transitions for funnel computation
-    all_transitions = []
-    for app in apps:
-        all_transitions.extend(list_status_transitions(conn, app.id))
+    all_transitions = list_all_status_transitions(conn)
 
     funnel = compute_funnel(apps, all_transitions)
 
@@ -2,26 +2,35 @@
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
 from contextlib import contextmanager
-from typing import NoReturn
+from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn
 
 import typer
 from rich.console import Console
 
 from emplaiyed.core.database import (
-    get_application,
+    get_applications_by_id_prefix,
     get_default_db_path,
-    get_work_item,
+    get_work_items_by_id_prefix,
     init_db,
-    list_applications,
-    list_work_items,
 )
-from emplaiyed.core.models import Profile
 from emplaiyed.core.profile_store import get_default_profile_path, load_profile
 
+if TYPE_CHECKING:
+    from emplaiyed.core.models import Profile
+
 console = Console()
 
+# Process-lifetime connection reused by every ``db_connection()`` block.
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+
+# (path, mtime_ns, size) of the last profile read, and the parsed result.
+_profile_cache: tuple[tuple[Path, int, int], Profile] | None = None
+
 
 def cli_error(message: str) -> NoReturn:
     """Print a red error message and exit with code 1."""
@@ -29,14 +38,66 @@ def cli_error(message: str) -> NoReturn:
     raise typer.Exit(code=1)
 
 
+def _get_connection() -> sqlite3.Connection:
+    """Return the shared connection, opening it (and running ``init_db``) once.
+
+    The connection is keyed on the resolved database path so that pointing
+    the CLI at another database transparently reopens it.
+    """
+    global _conn, _conn_path
+    path = get_default_db_path()
+    if _conn is not None and _conn_path == path:
+        return _conn
+    if _conn is None:
+        atexit.register(close_db_connection)
+    else:
+        _conn.close()
+    _conn = init_db(path)
+    _conn_path = path
+    return _conn
+
+
+def close_db_connection() -> None:
+    """Close the shared connection, if open.  Safe to call repeatedly."""
+    global _conn, _conn_path
+    if _conn is not None:
+        _conn.close()
+    _conn = None
+    _conn_path = None
+    atexit.unregister(close_db_connection)
+
+
 @contextmanager
 def db_connection():
-    """Context manager for the default database connection."""
-    conn = init_db(get_default_db_path())
+    """Context manager for the default database connection.
+
+    Yields a connection shared for the lifetime of the process; leaving the
+    block does not close it.  Uncommitted work is rolled back on error.
+    """
+    conn = _get_connection()
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def _load_profile_cached(profile_path: Path) -> Profile:
+    """Load the profile, reusing the last parse while the file is unchanged.
+
+    The cache is keyed on the file's mtime and size, so edits made by
+    ``profile build`` / ``profile enhance`` (or by hand) are picked up on
+    the next call without an explicit invalidation.
+    """
+    global _profile_cache
+    st = profile_path.stat()
+    key = (profile_path, st.st_mtime_ns, st.st_size)
+    if _profile_cache is not None and _profile_cache[0] == key:
+        return _profile_cache[1]
+    profile = load_profile(profile_path)
+    _profile_cache = (key, profile)
+    return profile
 
 
 def require_profile() -> Profile:
@@ -44,7 +105,7 @@ def require_profile() -> Profile:
     profile_path = get_default_profile_path()
     if not profile_path.exists():
         cli_error("No profile found. Run `emplaiyed profile build` first.")
-    return load_profile(profile_path)
+    return _load_profile_cached(profile_path)
 
 
 def try_load_profile() -> Profile | None:
@@ -53,36 +114,30 @@ def try_load_profile() -> Profile | None:
     if not profile_path.exists():
         return None
     try:
-        return load_profile(profile_path)
+        return _load_profile_cached(profile_path)
     except Exception:
         return None
 
 
 def resolve_application(conn: sqlite3.Connection, app_id: str):
-    """Resolve an application by exact ID or prefix. Exits on ambiguous/not found."""
-    app = get_application(conn, app_id)
-    if app is not None:
-        return app
-
-    all_apps = list_applications(conn)
-    matches = [a for a in all_apps if a.id.startswith(app_id)]
-    if len(matches) == 1:
+    """Resolve an application by exact ID or prefix. Exits on ambiguous/not found.
+
+    A single indexed query covers both cases: an exact ID is its own
+    prefix and sorts first among the matches.
+    """
+    matches = get_applications_by_id_prefix(conn, app_id)
+    if len(matches) == 1 or (matches and matches[0].id == app_id):
         return matches[0]
     if len(matches) > 1:
-        cli_error(f"Ambiguous ID: '{app_id}' matches {len(matches)} applications.")
+        cli_error(f"Ambiguous ID: '{app_id}' matches multiple applications.")
     cli_error(f"Application not found: '{app_id}'")
 
 
 def resolve_work_item(conn: sqlite3.Connection, item_id: str):
     """Resolve a work item by exact ID or prefix. Exits on ambiguous/not found."""
-    item = get_work_item(conn, item_id)
-    if item is not None:
-        return item
-
-    all_items = list_work_items(conn)
-    matches = [w for w in all_items if w.id.startswith(item_id)]
-    if len(matches) == 1:
+    matches = get_work_items_by_id_prefix(conn, item_id)
+    if len(matches) == 1 or (matches and matches[0].id == item_id):
         return matches[0]
     if len(matches) > 1:
-        cli_error(f"Ambiguous ID: '{item_id}' matches {len(matches)} items.")
+        cli_error(f"Ambiguous ID: '{item_id}' matches multiple items.")
     cli_error(f"Work item not found: '{item_id}'")
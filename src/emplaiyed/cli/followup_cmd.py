@@ -10,7 +10,26 @@ from rich.panel import Panel
 from emplaiyed.cli import console, db_connection, require_profile
 from emplaiyed.core.database import get_application
 from emplaiyed.core.models import ApplicationStatus
-from emplaiyed.followup import draft_followup, enqueue_followup, find_stale_applications
+
+# Max follow-up drafts requested from the LLM provider at once.
+_DRAFT_CONCURRENCY = 8
+
+
+async def _draft_all(profile, stale) -> list:
+    """Draft every follow-up concurrently; failures are returned as exceptions."""
+    from emplaiyed.followup import draft_followup
+
+    sem = asyncio.Semaphore(_DRAFT_CONCURRENCY)
+
+    async def _draft_one(next_status, opp, days):
+        followup_num = 1 if next_status == "FOLLOW_UP_1" else 2
+        async with sem:
+            return await draft_followup(profile, opp, followup_num, days)
+
+    return await asyncio.gather(
+        *(_draft_one(next_status, opp, days) for _, next_status, opp, days in stale),
+        return_exceptions=True,
+    )
 
 
 def followup_command(
@@ -19,6 +38,9 @@ def followup_command(
     ),
 ) -> None:
     """Check for applications needing follow-up and send messages."""
+    # Deferred: the follow-up agent pulls in pydantic-ai and the LLM clients.
+    from emplaiyed.followup import enqueue_followup, find_stale_applications
+
     profile = require_profile()
 
     with db_connection() as conn:
@@ -33,8 +55,12 @@ def followup_command(
             f"for {stale_days}+ days:\n"
         )
 
+        drafts = asyncio.run(_draft_all(profile, stale))
+
         queued_count = 0
-        for i, (app_id, next_status, opp, days) in enumerate(stale, 1):
+        for i, ((app_id, next_status, opp, days), draft) in enumerate(
+            zip(stale, drafts), 1
+        ):
             followup_num = 1 if next_status == "FOLLOW_UP_1" else 2
             target = ApplicationStatus(next_status)
 
@@ -43,10 +69,8 @@ def followup_command(
                 f"    Sent: {days} days ago"
             )
 
-            try:
-                draft = asyncio.run(draft_followup(profile, opp, followup_num, days))
-            except Exception as exc:
-                console.print(f"    [red]Failed to draft: {exc}[/red]\n")
+            if isinstance(draft, BaseException):
+                console.print(f"    [red]Failed to draft: {draft}[/red]\n")
                 continue
 
             console.print(Panel(
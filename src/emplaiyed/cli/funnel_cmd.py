@@ -9,9 +9,20 @@ from rich.panel import Panel
 from rich.table import Table
 
 from emplaiyed.cli import console, db_connection, resolve_application
-from emplaiyed.core.database import get_opportunity, list_applications, list_interactions
+from emplaiyed.core.database import (
+    count_applications_by_status,
+    get_opportunity,
+    iter_applications_with_opportunity,
+    list_interactions,
+)
 from emplaiyed.core.models import ApplicationStatus
 
+
+def _fmt_minutes(dt) -> str:
+    """Format as ``YYYY-MM-DD HH:MM`` (``isoformat`` avoids strftime's locale path)."""
+    return dt.isoformat(" ")[:16]
+
+
 funnel_app = typer.Typer(
     name="funnel",
     help="View and manage your application funnel.",
@@ -23,9 +34,10 @@ funnel_app = typer.Typer(
 def funnel_status() -> None:
     """Show a summary of how many applications are in each pipeline stage."""
     with db_connection() as conn:
-        applications = list_applications(conn)
+        counts = count_applications_by_status(conn)
+        total = sum(counts.values())
 
-        if not applications:
+        if not total:
             console.print(Panel(
                 "No applications tracked yet.\n\n"
                 "Add opportunities and start applying to see your funnel here.",
@@ -34,21 +46,17 @@ def funnel_status() -> None:
             ))
             return
 
-        counts: dict[str, int] = {s.value: 0 for s in ApplicationStatus}
-        for app in applications:
-            counts[app.status.value] += 1
-
         table = Table(title="Funnel Status")
         table.add_column("Stage", style="cyan")
         table.add_column("Count", justify="right")
 
         for status in ApplicationStatus:
-            count = counts[status.value]
+            count = counts.get(status.value, 0)
             style = "bold green" if count > 0 else "dim"
             table.add_row(status.value, str(count), style=style)
 
         table.add_section()
-        table.add_row("[bold]TOTAL[/bold]", f"[bold]{len(applications)}[/bold]")
+        table.add_row("[bold]TOTAL[/bold]", f"[bold]{total}[/bold]")
         console.print(table)
 
 
@@ -58,10 +66,12 @@ def funnel_list(
         None, "--stage", "-s",
         help="Filter by application stage (e.g. SCORED, OUTREACH_SENT).",
     ),
+    limit: int = typer.Option(50, "--limit", "-n", min=1, help="Rows per page."),
+    page: int = typer.Option(1, "--page", "-p", min=1, help="Page number (1-based)."),
 ) -> None:
     """List all applications, optionally filtered by stage."""
     with db_connection() as conn:
-        filters = {}
+        status_enum = None
         if stage:
             try:
                 status_enum = ApplicationStatus(stage.upper())
@@ -69,14 +79,6 @@ def funnel_list(
                 valid = ", ".join(s.value for s in ApplicationStatus)
                 console.print(f"[red]Invalid stage:[/red] {stage}\nValid stages: {valid}")
                 raise typer.Exit(code=1)
-            filters["status"] = status_enum
-
-        applications = list_applications(conn, **filters)
-
-        if not applications:
-            msg = f"No applications with stage [bold]{stage.upper()}[/bold]." if stage else "No applications tracked yet."
-            console.print(msg if stage else Panel(msg, title="Applications", border_style="yellow"))
-            return
 
         table = Table(title="Applications")
         table.add_column("ID", style="dim")
@@ -85,17 +87,30 @@ def funnel_list(
         table.add_column("Status")
         table.add_column("Last Updated")
 
-        for app in applications:
-            opp = get_opportunity(conn, app.opportunity_id)
+        # Rows go straight from the cursor into the table.
+        rows = iter_applications_with_opportunity(
+            conn, status=status_enum, limit=limit, offset=(page - 1) * limit
+        )
+        for app in rows:
             table.add_row(
                 app.id[:8],
-                opp.company if opp else "Unknown",
-                opp.title if opp else "Unknown",
-                app.status.value,
-                app.updated_at.strftime("%Y-%m-%d %H:%M"),
+                app.company or "Unknown",
+                app.title or "Unknown",
+                app.status,
+                app.updated_at[:16].replace("T", " "),
             )
 
+        if not table.row_count and page > 1:
+            console.print(f"[yellow]No applications on page {page}.[/yellow]")
+            return
+        if not table.row_count:
+            msg = f"No applications with stage [bold]{stage.upper()}[/bold]." if stage else "No applications tracked yet."
+            console.print(msg if stage else Panel(msg, title="Applications", border_style="yellow"))
+            return
+
         console.print(table)
+        if table.row_count == limit:
+            console.print(f"[dim]More may follow: --page {page + 1}[/dim]")
 
 
 @funnel_app.command("show")
@@ -114,8 +129,8 @@ def funnel_show(
             f"[bold]Company:[/bold]     {company}",
             f"[bold]Role:[/bold]        {role}",
             f"[bold]Status:[/bold]      {app.status.value}",
-            f"[bold]Created:[/bold]     {app.created_at.strftime('%Y-%m-%d %H:%M')}",
-            f"[bold]Updated:[/bold]     {app.updated_at.strftime('%Y-%m-%d %H:%M')}",
+            f"[bold]Created:[/bold]     {_fmt_minutes(app.created_at)}",
+            f"[bold]Updated:[/bold]     {_fmt_minutes(app.updated_at)}",
         ]
 
         if opp:
@@ -144,10 +159,10 @@ def funnel_show(
 
             for interaction in interactions:
                 content = interaction.content or "-"
-                if interaction.content and len(interaction.content) > 50:
-                    content = interaction.content[:47] + "..."
+                if len(content) > 50:
+                    content = content[:47] + "..."
                 int_table.add_row(
-                    interaction.created_at.strftime("%Y-%m-%d %H:%M"),
+                    _fmt_minutes(interaction.created_at),
                     interaction.type.value,
                     interaction.direction,
                     interaction.channel,
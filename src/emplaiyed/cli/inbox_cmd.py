@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import os
+import plistlib
+import subprocess
 import sys
 from pathlib import Path
-from textwrap import dedent
 
 import typer
 from rich.table import Table
 
 from emplaiyed.cli import console, db_connection
 
+_URGENCY_COLOR = {"high": "red", "medium": "yellow", "low": "dim"}
+
 inbox_app = typer.Typer(
     name="inbox",
     help="Monitor your email inbox for job-search replies.",
@@ -42,18 +45,19 @@ def check(
     with db_connection() as conn:
         result = asyncio.run(run_inbox_check(conn, since_days=days, dry_run=dry_run))
 
-    console.print(f"\n[bold]Inbox Check Results[/bold]")
-    console.print(f"  Fetched:           {result.total_fetched}")
-    console.print(f"  Already processed: {result.already_processed}")
-    console.print(f"  Classified:        {result.classified}")
-    console.print(f"  Matched to apps:   {result.matched}")
-    console.print(f"  Work items:        {result.work_items_created}")
-    console.print(f"  Telegram sent:     {result.notification_sent}")
-
+    summary = [
+        "\n[bold]Inbox Check Results[/bold]",
+        f"  Fetched:           {result.total_fetched}",
+        f"  Already processed: {result.already_processed}",
+        f"  Classified:        {result.classified}",
+        f"  Matched to apps:   {result.matched}",
+        f"  Work items:        {result.work_items_created}",
+        f"  Telegram sent:     {result.notification_sent}",
+    ]
     if result.errors:
-        console.print(f"\n[yellow]Warnings ({len(result.errors)}):[/yellow]")
-        for err in result.errors:
-            console.print(f"  - {err}")
+        summary.append(f"\n[yellow]Warnings ({len(result.errors)}):[/yellow]")
+        summary.extend(f"  - {err}" for err in result.errors)
+    console.print("\n".join(summary))
 
     if result.processed:
         console.print()
@@ -68,11 +72,7 @@ def check(
         for p in result.processed:
             matched = p.match.opportunity.company if p.match else "-"
             action = "Yes" if p.classification.requires_action else "-"
-            urgency_color = {
-                "high": "red",
-                "medium": "yellow",
-                "low": "dim",
-            }.get(p.classification.urgency, "")
+            urgency_color = _URGENCY_COLOR.get(p.classification.urgency, "")
             table.add_row(
                 p.email.from_name[:25],
                 p.email.subject[:35],
@@ -97,14 +97,7 @@ def history(
     limit: int = typer.Option(20, "--limit", "-n", help="Number of records to show."),
 ) -> None:
     """Show recently processed emails."""
-    from emplaiyed.core.database import list_processed_emails
-
-    with db_connection() as conn:
-        rows = list_processed_emails(conn, limit=limit)
-
-    if not rows:
-        console.print("[dim]No processed emails yet.[/dim]")
-        return
+    from emplaiyed.core.database import iter_processed_emails
 
     table = Table(title=f"Last {limit} Processed Emails")
     table.add_column("Processed At", max_width=20)
@@ -113,15 +106,20 @@ def history(
     table.add_column("Category")
     table.add_column("Matched App")
 
-    for row in rows:
-        processed_at = (row.get("processed_at") or "")[:19]
-        from_addr = (row.get("from_address") or "")[:25]
-        subject = (row.get("subject") or "")[:35]
-        category = row.get("category") or "-"
-        matched = row.get("matched_app_id") or "-"
-        if matched != "-":
-            matched = matched[:8]
-        table.add_row(processed_at, from_addr, subject, category, matched)
+    with db_connection() as conn:
+        for row in iter_processed_emails(conn, limit=limit):
+            processed_at = (row.get("processed_at") or "")[:19]
+            from_addr = (row.get("from_address") or "")[:25]
+            subject = (row.get("subject") or "")[:35]
+            category = row.get("category") or "-"
+            matched = row.get("matched_app_id") or "-"
+            if matched != "-":
+                matched = matched[:8]
+            table.add_row(processed_at, from_addr, subject, category, matched)
+
+    if not table.row_count:
+        console.print("[dim]No processed emails yet.[/dim]")
+        return
 
     console.print(table)
 
@@ -134,51 +132,43 @@ _PLIST_LABEL = "org.jpelletier.emplaiyed-inbox"
 _PLIST_DIR = Path.home() / "Library" / "LaunchAgents"
 _PLIST_PATH = _PLIST_DIR / f"{_PLIST_LABEL}.plist"
 
-_PLIST_TEMPLATE = dedent("""\
-    <?xml version="1.0" encoding="UTF-8"?>
-    <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-      "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-    <plist version="1.0">
-    <dict>
-        <key>Label</key>
-        <string>{label}</string>
-
-        <key>ProgramArguments</key>
-        <array>
-            <string>{python}</string>
-            <string>-m</string>
-            <string>emplaiyed</string>
-            <string>inbox</string>
-            <string>check</string>
-        </array>
-
-        <key>StartCalendarInterval</key>
-        <dict>
-            <key>Hour</key>
-            <integer>{hour}</integer>
-            <key>Minute</key>
-            <integer>{minute}</integer>
-        </dict>
-
-        <key>WorkingDirectory</key>
-        <string>{workdir}</string>
-
-        <key>EnvironmentVariables</key>
-        <dict>
-            <key>PATH</key>
-            <string>{path_env}</string>
-        </dict>
-
-        <key>StandardOutPath</key>
-        <string>{log_dir}/inbox-check.log</string>
-        <key>StandardErrorPath</key>
-        <string>{log_dir}/inbox-check.err</string>
-
-        <key>RunAtLoad</key>
-        <false/>
-    </dict>
-    </plist>
-""")
+
+def _build_plist(
+    *, hour: int, minute: int, workdir: Path, path_env: str, log_dir: Path
+) -> bytes:
+    """Serialize the launchd job definition (plistlib handles XML escaping)."""
+    return plistlib.dumps(
+        {
+            "Label": _PLIST_LABEL,
+            "ProgramArguments": [sys.executable, "-m", "emplaiyed", "inbox", "check"],
+            "StartCalendarInterval": {"Hour": hour, "Minute": minute},
+            "WorkingDirectory": str(workdir),
+            "EnvironmentVariables": {"PATH": path_env},
+            "StandardOutPath": str(log_dir / "inbox-check.log"),
+            "StandardErrorPath": str(log_dir / "inbox-check.err"),
+            "RunAtLoad": False,
+        },
+        sort_keys=False,
+    )
+
+
+def _launchctl(action: str, quiet: bool = False) -> int:
+    """Run ``launchctl <action> <plist>`` without a shell; return its exit code."""
+    try:
+        result = subprocess.run(
+            ["launchctl", action, str(_PLIST_PATH)],
+            stderr=subprocess.DEVNULL if quiet else None,
+            check=False,
+        )
+    except FileNotFoundError:
+        return 127  # launchctl not installed (not macOS)
+    return result.returncode
+
+
+def _reload_job() -> int:
+    """Unload any previous copy of the job (ignoring errors), then load it."""
+    _launchctl("unload", quiet=True)
+    return _launchctl("load")
 
 
 @inbox_app.command()
@@ -192,7 +182,7 @@ def setup(
     """Install (or remove) a macOS launchd job to run inbox check daily."""
     if uninstall:
         if _PLIST_PATH.exists():
-            os.system(f"launchctl unload '{_PLIST_PATH}' 2>/dev/null")
+            _launchctl("unload", quiet=True)
             _PLIST_PATH.unlink()
             console.print(f"[green]Removed[/green] {_PLIST_PATH}")
         else:
@@ -206,9 +196,7 @@ def setup(
     log_dir = project_root / "data" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    plist_content = _PLIST_TEMPLATE.format(
-        label=_PLIST_LABEL,
-        python=sys.executable,
+    plist_content = _build_plist(
         hour=hour,
         minute=minute,
         workdir=project_root,
@@ -217,13 +205,10 @@ def setup(
     )
 
     _PLIST_DIR.mkdir(parents=True, exist_ok=True)
-    _PLIST_PATH.write_text(plist_content)
+    _PLIST_PATH.write_bytes(plist_content)
     console.print(f"[green]Written[/green] {_PLIST_PATH}")
 
-    # Load the job
-    os.system(f"launchctl unload '{_PLIST_PATH}' 2>/dev/null")
-    ret = os.system(f"launchctl load '{_PLIST_PATH}'")
-    if ret == 0:
+    if _reload_job() == 0:
         console.print(
             f"[green]Loaded![/green] Inbox check will run daily at "
             f"{hour:02d}:{minute:02d}."
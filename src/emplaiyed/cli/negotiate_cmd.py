@@ -9,20 +9,51 @@ from rich.panel import Panel
 from rich.table import Table
 
 from emplaiyed.cli import cli_error, console, db_connection, require_profile, resolve_application
-from emplaiyed.core.database import get_application, get_opportunity, list_offers
+from emplaiyed.core.database import (
+    get_opportunity,
+    iter_offers_with_opportunity,
+    list_offers,
+)
 from emplaiyed.core.models import ApplicationStatus, WorkType
-from emplaiyed.negotiation import generate_negotiation
 from emplaiyed.work.queue import create_work_item
 
+_NEGOTIATE_INSTRUCTIONS = """\
+## Send counter-offer to {company} — {title}
+
+**Company:** {company}
+**Role:** {title}
+**Current offer:** ${salary:,}
+**Recommended counter:** ${counter:,}
+
+### What to do
+1. Copy the counter-offer email below
+2. Reply to the offer thread or send to the hiring contact
+3. Run: `emplaiyed work done <id>`
+
+### Draft email
+
+{draft}"""
+
+_ACCEPT_INSTRUCTIONS = """\
+## Accept offer from {company} — {title}
+
+**Company:** {company}
+**Role:** {title}
+**Salary:** {salary}
+
+### What to do
+1. Copy the acceptance email below
+2. Send to the hiring contact
+3. Run: `emplaiyed work done <id>`
+
+### Draft email
+
+{draft}"""
+
 
 def offers_command() -> None:
     """List all pending offers."""
     with db_connection() as conn:
-        offers = list_offers(conn)
-        if not offers:
-            console.print("[yellow]No offers recorded.[/yellow]")
-            return
-
         table = Table(title="Offers")
         table.add_column("Company")
         table.add_column("Role")
@@ -30,24 +61,33 @@ def offers_command() -> None:
         table.add_column("Deadline")
         table.add_column("Status")
 
-        for offer in offers:
-            app = get_application(conn, offer.application_id)
-            opp = get_opportunity(conn, app.opportunity_id) if app else None
+        # Stream the joined rows straight into the table.
+        for row in iter_offers_with_opportunity(conn):
             table.add_row(
-                opp.company if opp else "Unknown",
-                opp.title if opp else "Unknown",
-                f"${offer.salary:,}" if offer.salary else "-",
-                str(offer.deadline) if offer.deadline else "-",
-                offer.status.value,
+                row.company or "Unknown",
+                row.title or "Unknown",
+                f"${row.salary:,}" if row.salary else "-",
+                row.deadline or "-",
+                row.status,
             )
 
+        if not table.row_count:
+            console.print("[yellow]No offers recorded.[/yellow]")
+            return
         console.print(table)
 
 
 def negotiate_command(
     application_id: str = typer.Argument(help="Application ID (or prefix)."),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Regenerate instead of reusing a cached strategy."
+    ),
 ) -> None:
     """Generate a negotiation strategy for an offer."""
+    # Deferred: the negotiation agent pulls in pydantic-ai and the LLM clients.
+    from emplaiyed.llm.cache import cache_key, cached_call
+    from emplaiyed.negotiation import NegotiationStrategy, generate_negotiation
+
     profile = require_profile()
 
     with db_connection() as conn:
@@ -68,7 +108,12 @@ def negotiate_command(
         )
 
         try:
-            strategy = asyncio.run(generate_negotiation(profile, opp, offer))
+            strategy = asyncio.run(cached_call(
+                cache_key("negotiate", profile, opp, offer),
+                NegotiationStrategy,
+                lambda: generate_negotiation(profile, opp, offer),
+                refresh=no_cache,
+            ))
         except Exception as exc:
             cli_error(f"Strategy generation failed: {exc}")
 
@@ -81,23 +126,17 @@ def negotiate_command(
         ]
         if strategy.risks:
             lines.append("[bold]Risks:[/bold]")
-            for r in strategy.risks:
-                lines.append(f"  ! {r}")
+            lines.extend(f"  ! {r}" for r in strategy.risks)
 
         console.print(Panel("\n".join(lines), title="Negotiation Strategy", border_style="yellow"))
 
         draft_text = f"Subject: {strategy.counter_email_subject}\n\n{strategy.counter_email_body}"
-        instructions = (
-            f"## Send counter-offer to {opp.company} — {opp.title}\n\n"
-            f"**Company:** {opp.company}\n"
-            f"**Role:** {opp.title}\n"
-            f"**Current offer:** ${offer.salary:,}\n"
-            f"**Recommended counter:** ${strategy.recommended_counter:,}\n\n"
-            f"### What to do\n"
-            f"1. Copy the counter-offer email below\n"
-            f"2. Reply to the offer thread or send to the hiring contact\n"
-            f"3. Run: `emplaiyed work done <id>`\n\n"
-            f"### Draft email\n\n{draft_text}"
+        instructions = _NEGOTIATE_INSTRUCTIONS.format(
+            company=opp.company,
+            title=opp.title,
+            salary=offer.salary,
+            counter=strategy.recommended_counter,
+            draft=draft_text,
         )
 
         item = create_work_item(
@@ -154,16 +193,8 @@ def accept_command(
         draft_text = f"Subject: Acceptance — {opp.title}\n\n{body}"
         console.print(Panel(body, title="Acceptance Email", border_style="green"))
 
-        instructions = (
-            f"## Accept offer from {opp.company} — {opp.title}\n\n"
-            f"**Company:** {opp.company}\n"
-            f"**Role:** {opp.title}\n"
-            f"**Salary:** {salary_str}\n\n"
-            f"### What to do\n"
-            f"1. Copy the acceptance email below\n"
-            f"2. Send to the hiring contact\n"
-            f"3. Run: `emplaiyed work done <id>`\n\n"
-            f"### Draft email\n\n{draft_text}"
+        instructions = _ACCEPT_INSTRUCTIONS.format(
+            company=opp.company, title=opp.title, salary=salary_str, draft=draft_text
         )
 
         item = create_work_item(
@@ -8,10 +8,38 @@ import typer
 from rich.panel import Panel
 
 from emplaiyed.cli import console, db_connection, require_profile
-from emplaiyed.core.database import get_opportunity, list_applications, list_work_items
+from emplaiyed.core.database import (
+    application_ids_with_work,
+    get_opportunities_many,
+    list_applications,
+)
 from emplaiyed.core.models import ApplicationStatus
-from emplaiyed.generation.pipeline import generate_assets_and_enqueue
-from emplaiyed.outreach import draft_outreach, send_outreach
+
+
+# Max targets drafted / generated against the LLM provider at once.
+_OUTREACH_CONCURRENCY = 8
+
+
+async def _prepare_all(conn, profile, targets, auto_send: bool) -> list:
+    """Draft emails (auto-send) or generate assets for every target concurrently.
+
+    Results come back in target order; failures are returned as exceptions.
+    """
+    from emplaiyed.generation.pipeline import generate_assets_and_enqueue
+    from emplaiyed.outreach import draft_outreach
+
+    sem = asyncio.Semaphore(_OUTREACH_CONCURRENCY)
+
+    async def _prepare_one(app_record, opp):
+        async with sem:
+            if auto_send:
+                return await draft_outreach(profile, opp)
+            return await generate_assets_and_enqueue(conn, profile, opp, app_record.id)
+
+    return await asyncio.gather(
+        *(_prepare_one(app_record, opp) for app_record, opp in targets),
+        return_exceptions=True,
+    )
 
 
 def outreach_command(
@@ -21,8 +49,14 @@ def outreach_command(
     auto_send: bool = typer.Option(
         False, "--auto-send", help="Send without confirmation (default: prompt)."
     ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Don't print each draft email when auto-sending."
+    ),
 ) -> None:
     """Draft and send outreach for top-scored opportunities."""
+    # Deferred: the outreach agent pulls in pydantic-ai and the LLM clients.
+    from emplaiyed.outreach import send_outreach
+
     profile = require_profile()
 
     with db_connection() as conn:
@@ -32,14 +66,10 @@ def outreach_command(
             return
 
         # Filter to apps that don't already have work items
-        apps_with_work = {w.application_id for w in list_work_items(conn)}
-        targets = [
-            (a, opp)
-            for a in apps
-            if a.id not in apps_with_work
-            for opp in [get_opportunity(conn, a.opportunity_id)]
-            if opp
-        ]
+        have_work = application_ids_with_work(conn, (a.id for a in apps))
+        need = [a for a in apps if a.id not in have_work]
+        opps = get_opportunities_many(conn, (a.opportunity_id for a in need))
+        targets = [(a, opps[a.opportunity_id]) for a in need if a.opportunity_id in opps]
 
         if not targets:
             console.print("[yellow]No opportunities need outreach (all have work items).[/yellow]")
@@ -47,38 +77,36 @@ def outreach_command(
 
         console.print(f"Found [bold]{len(targets)}[/bold] scored opportunities. Preparing...\n")
 
+        results = asyncio.run(_prepare_all(conn, profile, targets, auto_send))
+
         queued_count = 0
-        for i, (app_record, opp) in enumerate(targets, 1):
-            console.print(f"[bold][{i}/{len(targets)}][/bold] {opp.company} — {opp.title}")
+        for i, ((app_record, opp), result) in enumerate(zip(targets, results), 1):
+            # Collect each target's output and render it in one print call.
+            out: list = [f"[bold][{i}/{len(targets)}][/bold] {opp.company} — {opp.title}"]
+
+            if isinstance(result, BaseException):
+                label = "Failed to draft" if auto_send else "Failed"
+                out.append(f"  [red]{label}: {result}[/red]")
+                console.print(*out, sep="\n")
+                continue
 
             if auto_send:
-                try:
-                    draft = asyncio.run(draft_outreach(profile, opp))
-                except Exception as exc:
-                    console.print(f"  [red]Failed to draft: {exc}[/red]")
-                    continue
-
-                console.print(Panel(
-                    f"[bold]Subject:[/bold] {draft.subject}\n\n{draft.body}",
-                    title="Draft email",
-                    border_style="blue",
-                ))
-                send_outreach(conn, app_record.id, draft)
-                console.print("  [green]Sent (auto-send)[/green]\n")
+                if not quiet:
+                    out.append(Panel(
+                        f"[bold]Subject:[/bold] {result.subject}\n\n{result.body}",
+                        title="Draft email",
+                        border_style="blue",
+                    ))
+                send_outreach(conn, app_record.id, result)
+                out.append("  [green]Sent (auto-send)[/green]\n")
             else:
-                try:
-                    paths = asyncio.run(
-                        generate_assets_and_enqueue(conn, profile, opp, app_record.id)
-                    )
-                    console.print(
-                        f"  [blue]Assets generated + work item created[/blue]\n"
-                        f"  CV: {paths.cv_pdf}\n"
-                        f"  Letter: {paths.letter_pdf}\n"
-                    )
-                except Exception as exc:
-                    console.print(f"  [red]Failed: {exc}[/red]")
-                    continue
+                out.append(
+                    f"  [blue]Assets generated + work item created[/blue]\n"
+                    f"  CV: {result.cv_pdf}\n"
+                    f"  Letter: {result.letter_pdf}\n"
+                )
 
+            console.print(*out, sep="\n")
             queued_count += 1
 
         if queued_count:
@@ -9,13 +9,19 @@ from rich.panel import Panel
 
 from emplaiyed.cli import cli_error, console, db_connection, require_profile, resolve_application
 from emplaiyed.core.database import get_opportunity
-from emplaiyed.prep import generate_prep
 
 
 def prep_command(
     application_id: str = typer.Argument(help="Application ID (or prefix)."),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Regenerate instead of reusing a cached sheet."
+    ),
 ) -> None:
     """Generate an interview prep cheat sheet for an application."""
+    # Deferred: the prep agent pulls in pydantic-ai and the LLM clients.
+    from emplaiyed.llm.cache import cache_key, cached_call
+    from emplaiyed.prep import PrepSheet, generate_prep
+
     profile = require_profile()
 
     with db_connection() as conn:
@@ -27,30 +33,34 @@ def prep_command(
         console.print(f"\nPreparing for: [bold]{opp.company}[/bold] — {opp.title}\n")
 
         try:
-            sheet = asyncio.run(generate_prep(profile, opp))
+            sheet = asyncio.run(cached_call(
+                cache_key("prep", profile, opp),
+                PrepSheet,
+                lambda: generate_prep(profile, opp),
+                refresh=no_cache,
+            ))
         except Exception as exc:
             cli_error(f"Prep generation failed: {exc}")
 
         lines = [f"[bold]Company:[/bold] {sheet.company_summary}\n"]
 
         lines.append("[bold]LIKELY QUESTIONS[/bold]")
+        answers = sheet.suggested_answers
         for j, q in enumerate(sheet.likely_questions, 1):
             lines.append(f"  {j}. {q}")
-            if j <= len(sheet.suggested_answers):
-                lines.append(f"     -> {sheet.suggested_answers[j - 1]}")
+            if j <= len(answers):
+                lines.append(f"     -> {answers[j - 1]}")
         lines.append("")
 
         lines.append("[bold]QUESTIONS TO ASK THEM[/bold]")
-        for q in sheet.questions_to_ask:
-            lines.append(f"  * {q}")
+        lines.extend(f"  * {q}" for q in sheet.questions_to_ask)
         lines.append("")
 
         lines.append(f"[bold]SALARY NOTES[/bold]\n  {sheet.salary_notes}\n")
 
         if sheet.red_flags:
             lines.append("[bold]RED FLAGS TO WATCH FOR[/bold]")
-            for rf in sheet.red_flags:
-                lines.append(f"  ! {rf}")
+            lines.extend(f"  ! {rf}" for rf in sheet.red_flags)
 
         console.print(Panel(
             "\n".join(lines),
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
@@ -42,8 +42,11 @@ def profile_show() -> None:
         console.print(f"[red]Error loading profile:[/red] {exc}")
         raise typer.Exit(code=1)
 
+    # Collect every section and render them with a single print.
+    sections: list = []
+
     # -- Header --
-    console.print(
+    sections.append(
         Panel(
             f"[bold]{profile.name}[/bold]\n"
             f"{profile.email}" + (f"  |  {profile.phone}" if profile.phone else ""),
@@ -54,7 +57,7 @@ def profile_show() -> None:
 
     # -- Skills --
     if profile.skills:
-        console.print(
+        sections.append(
             Panel(", ".join(profile.skills), title="Skills", border_style="green")
         )
 
@@ -65,7 +68,7 @@ def profile_show() -> None:
         lang_table.add_column("Proficiency")
         for lang in profile.languages:
             lang_table.add_row(lang.language, lang.proficiency)
-        console.print(lang_table)
+        sections.append(lang_table)
 
     # -- Education --
     if profile.education:
@@ -83,7 +86,7 @@ def profile_show() -> None:
                 str(edu.start_date) if edu.start_date else "-",
                 str(edu.end_date) if edu.end_date else "-",
             )
-        console.print(edu_table)
+        sections.append(edu_table)
 
     # -- Employment History --
     if profile.employment_history:
@@ -104,7 +107,7 @@ def profile_show() -> None:
             if emp.highlights:
                 for hl in emp.highlights:
                     emp_table.add_row("", "", "", "", f"  - {hl}")
-        console.print(emp_table)
+        sections.append(emp_table)
 
     # -- Certifications --
     if profile.certifications:
@@ -118,7 +121,7 @@ def profile_show() -> None:
                 cert.issuer,
                 str(cert.date_obtained) if cert.date_obtained else "-",
             )
-        console.print(cert_table)
+        sections.append(cert_table)
 
     # -- Aspirations --
     if profile.aspirations:
@@ -145,9 +148,12 @@ def profile_show() -> None:
             lines.append(f"[bold]Arrangement:[/bold] {', '.join(asp.work_arrangement)}")
         if asp.statement:
             lines.append(f"\n{asp.statement}")
-        console.print(
-            Panel("\n".join(lines), title="Aspirations", border_style="magenta")
-        )
+        if lines:
+            sections.append(
+                Panel("\n".join(lines), title="Aspirations", border_style="magenta")
+            )
+
+    console.print(Group(*sections))
 
 
 @profile_app.command("path")
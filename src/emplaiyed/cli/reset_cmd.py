@@ -6,7 +6,7 @@ import shutil
 
 import typer
 
-from emplaiyed.cli import console
+from emplaiyed.cli import close_db_connection, console
 from emplaiyed.core.database import get_default_db_path
 from emplaiyed.core.paths import find_project_root
 
@@ -27,13 +27,23 @@ def reset_command(
             console.print("[dim]Cancelled.[/dim]")
             raise typer.Exit()
 
+    # Release the shared handle so we don't keep writing to an unlinked file.
+    close_db_connection()
+
+    # Attempt the removal directly; a missing path is the "already clean" case.
     deleted = []
-    if db_path.exists():
+    try:
         db_path.unlink()
+    except FileNotFoundError:
+        pass
+    else:
         deleted.append("database")
 
-    if assets_dir.exists():
+    try:
         shutil.rmtree(assets_dir)
+    except FileNotFoundError:
+        pass
+    else:
         deleted.append("assets")
 
     if deleted:
@@ -2,18 +2,50 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import typer
 from rich.table import Table
 
 from emplaiyed.cli import cli_error, console, db_connection, resolve_application
-from emplaiyed.core.database import get_application, get_opportunity, list_upcoming_events, save_event
+from emplaiyed.core.database import (
+    get_applications_many,
+    get_opportunities_many,
+    get_opportunity,
+    list_upcoming_events,
+    save_event,
+)
 from emplaiyed.core.models import ApplicationStatus, ScheduledEvent
 from emplaiyed.tracker.state_machine import can_transition, transition
 
 
+# Fallback for entries like "2025-01-14 2pm" or "2025-01-14 2:30 PM".
+_DATE_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{1,2})(?::(\d{2}))?\s*(am|pm)?$", re.I
+)
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse an ISO date/time, also accepting 12-hour times. Raises ValueError."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        m = _DATE_RE.match(date_str.strip())
+        if m is None:
+            raise
+    year, month, day, hour, minute, meridiem = m.groups()
+    hour = int(hour)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Invalid 12-hour time: {date_str!r}")
+        hour = hour % 12 + (12 if meridiem.lower() == "pm" else 0)
+    return datetime(int(year), int(month), int(day), hour, int(minute or 0))
+
+
+@lru_cache(maxsize=64)
 def _format_event_type(event_type: str) -> str:
     return event_type.replace("_", " ").title()
 
@@ -25,7 +57,8 @@ def schedule_command(
         help="Event type (e.g. phone_screen, technical_interview, onsite, follow_up_due).",
     ),
     date_str: str = typer.Option(
-        ..., "--date", "-d", help="Scheduled date/time (e.g. '2025-01-14 14:00').",
+        ..., "--date", "-d",
+        help="Scheduled date/time (e.g. '2025-01-14 14:00' or '2025-01-14 2pm').",
     ),
     notes: Optional[str] = typer.Option(
         None, "--notes", "-n", help="Optional notes about the event.",
@@ -33,11 +66,12 @@ def schedule_command(
 ) -> None:
     """Schedule an event (interview, follow-up, etc.) for an application."""
     try:
-        scheduled_date = datetime.fromisoformat(date_str)
+        scheduled_date = _parse_date(date_str)
     except ValueError:
         cli_error(
             f"Invalid date format: '{date_str}'\n"
-            "Use ISO format, e.g. '2025-01-14 14:00' or '2025-01-14T14:00:00'."
+            "Use ISO format, e.g. '2025-01-14 14:00' or '2025-01-14T14:00:00',\n"
+            "or a 12-hour time such as '2025-01-14 2pm'."
         )
 
     with db_connection() as conn:
@@ -50,27 +84,33 @@ def schedule_command(
             notes=notes,
             created_at=datetime.now(),
         )
-        save_event(conn, event)
-
-        if can_transition(app.status, ApplicationStatus.INTERVIEW_SCHEDULED):
-            transition(conn, app.id, ApplicationStatus.INTERVIEW_SCHEDULED)
+        # Record the event and advance the application in one commit.
+        with conn:
+            save_event(conn, event, commit=False)
+            if can_transition(app.status, ApplicationStatus.INTERVIEW_SCHEDULED):
+                transition(conn, app.id, ApplicationStatus.INTERVIEW_SCHEDULED, commit=False)
 
         opp = get_opportunity(conn, app.opportunity_id)
         company = opp.company if opp else "Unknown"
         role = opp.title if opp else "Unknown"
 
         formatted_date = scheduled_date.strftime("%b %d at %I:%M %p")
-        console.print(f"\n[green]\\u2713[/green] {_format_event_type(event_type)} scheduled for {formatted_date}")
-        console.print(f"  Application: {company} — {role}")
+        lines = [
+            f"\n[green]\\u2713[/green] {_format_event_type(event_type)} scheduled for {formatted_date}",
+            f"  Application: {company} — {role}",
+        ]
         if notes:
-            console.print(f"  Notes: {notes}")
-        console.print(f"  Run `emplaiyed prep {app.id[:8]}` anytime.\n")
+            lines.append(f"  Notes: {notes}")
+        lines.append(f"  Run `emplaiyed prep {app.id[:8]}` anytime.\n")
+        console.print("\n".join(lines))
 
 
-def calendar_command() -> None:
-    """Show all upcoming scheduled events."""
+def calendar_command(
+    limit: int = typer.Option(50, "--limit", "-n", min=1, help="Max events to show."),
+) -> None:
+    """Show upcoming scheduled events."""
     with db_connection() as conn:
-        events = list_upcoming_events(conn)
+        events = list_upcoming_events(conn, limit=limit)
 
         if not events:
             console.print("\n[dim]No upcoming events scheduled.[/dim]\n")
@@ -83,18 +123,28 @@ def calendar_command() -> None:
         table.add_column("Type")
         table.add_column("Application", style="dim")
 
+        apps = get_applications_many(conn, (e.application_id for e in events))
+        opps = get_opportunities_many(conn, (a.opportunity_id for a in apps.values()))
+
         for event in events:
-            app = get_application(conn, event.application_id)
-            opp = get_opportunity(conn, app.opportunity_id) if app else None
+            app = apps.get(event.application_id)
+            opp = opps.get(app.opportunity_id) if app else None
             company = opp.company if opp else "Unknown"
 
-            date_str = event.scheduled_date.strftime("%b %d")
-            time_str = event.scheduled_date.strftime("%H:%M")
-            if event.scheduled_date.hour == 0 and event.scheduled_date.minute == 0:
-                time_str = "\u2014"
+            when = event.scheduled_date
+            # Midnight means "date only" — show a dash instead of 00:00.
+            time_str = when.strftime("%H:%M") if when.hour or when.minute else "\u2014"
 
-            table.add_row(date_str, time_str, company, _format_event_type(event.event_type), event.application_id[:8])
+            table.add_row(
+                when.strftime("%b %d"),
+                time_str,
+                company,
+                _format_event_type(event.event_type),
+                event.application_id[:8],
+            )
 
         console.print()
         console.print(table)
+        if len(events) == limit:
+            console.print(f"[dim]Showing the next {limit} events; raise --limit to see more.[/dim]")
         console.print()
@@ -9,14 +9,18 @@ from typing import Optional
 import typer
 from rich.table import Table
 
-from emplaiyed.cli import console, try_load_profile
-from emplaiyed.core.database import get_default_db_path, init_db, list_applications
+from emplaiyed.cli import console, db_connection, try_load_profile
+from emplaiyed.core.database import list_applications
 from emplaiyed.core.models import ApplicationStatus
+from emplaiyed.core.profile_store import get_default_profile_path
 from emplaiyed.sources import get_available_sources
 from emplaiyed.sources.base import SearchQuery
 
 logger = logging.getLogger(__name__)
 
+# Scrapers are network-bound; cap how many run at once in ``scan-all``.
+_SCAN_CONCURRENCY = 8
+
 sources_app = typer.Typer(
     name="sources",
     help="Manage and run job sources / scrapers.",
@@ -42,7 +46,10 @@ def list_sources():
 
 @sources_app.command("scan")
 def scan(
-    source: str = typer.Option(..., "--source", "-s", help="Source name to scan."),
+    source: str = typer.Option(
+        ..., "--source", "-s",
+        help="Source name to scan (comma-separate several to scan them concurrently).",
+    ),
     keywords: Optional[str] = typer.Option(
         None, "--keywords", "-k", help="Comma-separated keywords (derived from profile if omitted)."
     ),
@@ -50,24 +57,115 @@ def scan(
         None, "--location", "-l", help="Location filter (derived from profile if omitted)."
     ),
     max_results: int = typer.Option(50, "--max-results", "-n", help="Max results."),
+    score: Optional[bool] = typer.Option(
+        None, "--score/--no-score",
+        help="Score results against the profile (default: only if a profile exists).",
+    ),
+    use_profile: bool = typer.Option(
+        True, "--profile/--no-profile",
+        help="Read the profile to fill in keywords/location and to score.",
+    ),
 ):
     """Run a scraper and show results."""
     available = get_available_sources()
-    if source not in available:
+    names = list(dict.fromkeys(n.strip() for n in source.split(",") if n.strip()))
+    for name in names:
+        if name not in available:
+            console.print(
+                f"[red]Unknown source '{name}'. "
+                f"Available: {', '.join(available.keys())}[/red]"
+            )
+            raise typer.Exit(code=1)
+    if not names:
+        console.print("[red]No source given.[/red]")
+        raise typer.Exit(code=1)
+
+    score = _resolve_score(score, use_profile)
+    profile, query = _build_query(keywords, location, max_results, use_profile)
+
+    console.print(
+        f"Scanning [cyan]{', '.join(names)}[/cyan] for "
+        f"keywords={query.keywords}, location={query.location} ..."
+    )
+
+    with db_connection() as db_conn:
+        if len(names) == 1:
+            src = available[names[0]]
+            asyncio.run(_run_scan(src, query, profile, db_conn, score, names[0]))
+        else:
+            selected = {name: available[name] for name in names}
+            asyncio.run(_run_scan_all(selected, query, profile, db_conn, score))
+
+
+@sources_app.command("scan-all")
+def scan_all(
+    keywords: Optional[str] = typer.Option(
+        None, "--keywords", "-k", help="Comma-separated keywords (derived from profile if omitted)."
+    ),
+    location: Optional[str] = typer.Option(
+        None, "--location", "-l", help="Location filter (derived from profile if omitted)."
+    ),
+    max_results: int = typer.Option(50, "--max-results", "-n", help="Max results per source."),
+    score: Optional[bool] = typer.Option(
+        None, "--score/--no-score",
+        help="Score results against the profile (default: only if a profile exists).",
+    ),
+    use_profile: bool = typer.Option(
+        True, "--profile/--no-profile",
+        help="Read the profile to fill in keywords/location and to score.",
+    ),
+):
+    """Run every implemented scraper concurrently and show results."""
+    sources = {
+        name: src for name, src in get_available_sources().items() if src.implemented
+    }
+    score = _resolve_score(score, use_profile)
+    profile, query = _build_query(keywords, location, max_results, use_profile)
+
+    console.print(
+        f"Scanning [cyan]{', '.join(sources)}[/cyan] for "
+        f"keywords={query.keywords}, location={query.location} ..."
+    )
+
+    with db_connection() as db_conn:
+        asyncio.run(_run_scan_all(sources, query, profile, db_conn, score))
+
+
+def _resolve_score(score, use_profile):
+    """Turn scoring off under ``--no-profile``; exit if ``--score`` asked for it."""
+    if use_profile:
+        return score
+    if score:
         console.print(
-            f"[red]Unknown source '{source}'. "
-            f"Available: {', '.join(available.keys())}[/red]"
+            "[red]--score needs the profile; it cannot be combined with --no-profile.[/red]"
         )
         raise typer.Exit(code=1)
+    return False
 
-    profile = try_load_profile()
+
+def _build_query(keywords, location, max_results, use_profile=True):
+    """Resolve the search query, deriving missing fields from the profile.
+
+    Returns ``(profile, query)``; the profile is None when it was not
+    needed, disabled with ``use_profile=False``, or does not exist.  Exits
+    when no keywords can be determined.  Scoring loads the profile itself
+    later if it is still missing (see :func:`_scoring_profile`).
+    """
+    # Only parse the profile when keywords or location must be derived.
+    profile = None
+    if use_profile and (keywords is None or location is None):
+        profile = try_load_profile()
 
     # Derive keywords and/or location from profile when not provided
     kw_list: list[str] = []
     if keywords is not None:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
-    elif profile:
-        kw_list, location = _derive_from_profile(profile, location)
+    if profile:
+        derived, location = _derive_from_profile(
+            profile, location, derive_keywords=keywords is None
+        )
+        if keywords is None:
+            kw_list = derived
 
     if not kw_list:
         console.print(
@@ -76,49 +174,74 @@ def scan(
         )
         raise typer.Exit(code=1)
 
-    # If location still not set, try deriving from profile
-    if location is None and profile and profile.aspirations:
-        for pref in profile.aspirations.geographic_preferences:
-            if pref.lower().strip() != "remote":
-                location = pref
-                console.print(f"[dim]Derived location from profile: {location}[/dim]")
-                break
-
-    query = SearchQuery(keywords=kw_list, location=location, max_results=max_results)
+    return profile, SearchQuery(keywords=kw_list, location=location, max_results=max_results)
 
-    src = available[source]
-    console.print(
-        f"Scanning [cyan]{source}[/cyan] for "
-        f"keywords={query.keywords}, location={query.location} ..."
-    )
 
-    db_conn = init_db(get_default_db_path())
+async def _run_scan(src, query, profile, db_conn, score, source) -> None:
+    """Scrape, score and generate assets on a single event loop."""
     try:
-        try:
-            results = asyncio.run(src.scrape_and_persist(query, db_conn))
-        except NotImplementedError as exc:
-            console.print(f"[yellow]{exc}[/yellow]")
-            raise typer.Exit(code=1)
+        results = await src.scrape_and_persist(query, db_conn)
+    except NotImplementedError as exc:
+        console.print(f"[yellow]{exc}[/yellow]")
+        raise typer.Exit(code=1)
+
+    await _process_results(source, results, profile, db_conn, score)
 
-        if not results:
-            console.print("[yellow]No new opportunities found.[/yellow]")
-            return
 
-        console.print(f"[green]{len(results)} new opportunities found.[/green]")
+async def _run_scan_all(sources, query, profile, db_conn, score) -> None:
+    """Scrape all *sources* concurrently, then score and generate once."""
+    sem = asyncio.Semaphore(_SCAN_CONCURRENCY)
 
-        # Score + eager asset generation
-        scored = _score_results(profile, results, db_conn)
+    async def _scrape(src):
+        async with sem:
+            return await src.scrape_and_persist(query, db_conn)
 
-        if scored:
-            asset_count = _eager_generate_assets(profile, scored, db_conn)
-            _show_scored_table(source, scored, db_conn, asset_count)
+    outcomes = await asyncio.gather(
+        *(_scrape(src) for src in sources.values()), return_exceptions=True
+    )
+
+    results = []
+    for name, outcome in zip(sources, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Scan of %s failed: %s", name, outcome)
+            console.print(f"[yellow]{name}: failed ({outcome})[/yellow]")
         else:
-            _show_unscored_table(source, results)
-    finally:
-        db_conn.close()
+            console.print(f"[dim]{name}: {len(outcome)} new[/dim]")
+            results.extend(outcome)
+
+    await _process_results("all", results, profile, db_conn, score)
 
 
-def _score_results(profile, results, db_conn):
+async def _process_results(source, results, profile, db_conn, score) -> None:
+    """Report new results, then score them and generate assets if enabled."""
+    if not results:
+        console.print("[yellow]No new opportunities found.[/yellow]")
+        return
+
+    console.print(f"[green]{len(results)} new opportunities found.[/green]")
+
+    # Score + eager asset generation
+    scored = None
+    if score is not False:
+        if profile is None:
+            profile = _scoring_profile(score)
+        scored = await _score_results(profile, results, db_conn)
+
+    if scored:
+        asset_count = await _eager_generate_assets(profile, scored, db_conn)
+        _show_scored_table(source, scored, db_conn, asset_count)
+    else:
+        _show_unscored_table(source, results)
+
+
+def _scoring_profile(score):
+    """Load the profile for scoring; by default only if its file exists."""
+    if score is None and not get_default_profile_path().exists():
+        return None
+    return try_load_profile()
+
+
+async def _score_results(profile, results, db_conn):
     """Try to score results against the profile. Returns scored list or None."""
     if profile is None:
         console.print("[dim]No profile found — skipping scoring.[/dim]")
@@ -128,14 +251,14 @@ def _score_results(profile, results, db_conn):
 
     console.print("Scoring against your profile...")
     try:
-        return asyncio.run(score_opportunities(profile, results, db_conn=db_conn))
+        return await score_opportunities(profile, results, db_conn=db_conn)
     except Exception as exc:
         logger.warning("Scoring failed: %s", exc)
         console.print(f"[yellow]Scoring failed: {exc}[/yellow]")
         return None
 
 
-def _eager_generate_assets(profile, scored, db_conn) -> int:
+async def _eager_generate_assets(profile, scored, db_conn) -> int:
     """Generate assets for top N scored opportunities. Returns count created."""
     if profile is None:
         return 0
@@ -146,9 +269,9 @@ def _eager_generate_assets(profile, scored, db_conn) -> int:
     opp_to_app = {a.opportunity_id: a.id for a in apps}
 
     scored_apps = [
-        (opp_to_app[so.opportunity.id], so.opportunity)
+        (app_id, so.opportunity)
         for so in scored
-        if so.opportunity.id in opp_to_app
+        if (app_id := opp_to_app.get(so.opportunity.id)) is not None
     ]
 
     if not scored_apps:
@@ -156,7 +279,7 @@ def _eager_generate_assets(profile, scored, db_conn) -> int:
 
     console.print("Generating assets for top opportunities...")
     try:
-        results = asyncio.run(generate_assets_batch(db_conn, profile, scored_apps))
+        results = await generate_assets_batch(db_conn, profile, scored_apps)
         return len(results)
     except Exception as exc:
         logger.warning("Asset generation failed: %s", exc)
@@ -167,31 +290,28 @@ def _eager_generate_assets(profile, scored, db_conn) -> int:
 def _show_scored_table(source, scored, db_conn, asset_count):
     """Display scored results summary."""
     above_70 = sum(1 for s in scored if s.score >= 70)
-    console.print(
-        f"\n[green]{len(scored)} opportunities scored. {above_70} scored above 70.[/green]"
-    )
+    lines = [f"\n[green]{len(scored)} opportunities scored. {above_70} scored above 70.[/green]"]
     if asset_count:
-        console.print(
-            f"[blue]{asset_count} sets of assets generated.[/blue]"
-        )
-    console.print("Run [cyan]emplaiyed console[/cyan] to review and manage them.")
+        lines.append(f"[blue]{asset_count} sets of assets generated.[/blue]")
+    lines.append("Run [cyan]emplaiyed console[/cyan] to review and manage them.")
+    console.print("\n".join(lines))
 
 
 def _show_unscored_table(source, results):
     """Display unscored results summary."""
-    console.print(f"\n[green]{len(results)} new opportunities saved (unscored).[/green]")
-    console.print("Run [cyan]emplaiyed console[/cyan] to review and manage them.")
+    console.print(
+        f"\n[green]{len(results)} new opportunities saved (unscored).[/green]\n"
+        "Run [cyan]emplaiyed console[/cyan] to review and manage them."
+    )
 
 
-def _derive_from_profile(profile, location):
-    """Derive keywords + location from a loaded profile."""
+def _derive_from_profile(profile, location, *, derive_keywords=True):
+    """Derive keywords (if asked) and a missing location from a loaded profile."""
     kw_list: list[str] = []
-    if profile.aspirations and profile.aspirations.target_roles:
-        kw_list.extend(profile.aspirations.target_roles)
-    if profile.skills:
-        kw_list.extend(profile.skills[:5])
-    if kw_list:
-        console.print(f"[dim]Derived keywords from profile: {', '.join(kw_list)}[/dim]")
+    if derive_keywords:
+        kw_list = _derive_keywords(profile)
+        if kw_list:
+            console.print(f"[dim]Derived keywords from profile: {', '.join(kw_list)}[/dim]")
 
     if location is None and profile.aspirations:
         for pref in profile.aspirations.geographic_preferences:
@@ -203,6 +323,25 @@ def _derive_from_profile(profile, location):
     return kw_list, location
 
 
+def _derive_keywords(profile) -> list[str]:
+    """Target roles followed by the top skills, deduplicated."""
+    candidates: list[str] = []
+    if profile.aspirations and profile.aspirations.target_roles:
+        candidates.extend(profile.aspirations.target_roles)
+    if profile.skills:
+        candidates.extend(profile.skills[:5])
+
+    # Drop blanks and case-insensitive duplicates, keeping first occurrence.
+    kw_list: list[str] = []
+    seen: set[str] = set()
+    for kw in candidates:
+        kw = kw.strip()
+        if kw and kw.casefold() not in seen:
+            seen.add(kw.casefold())
+            kw_list.append(kw)
+    return kw_list
+
+
 @sources_app.command("search")
 def search(
     direction: Optional[str] = typer.Argument(
@@ -216,8 +355,6 @@ def search(
     Optionally pass a direction to steer the search:
         emplaiyed sources search "find me applied AI engineer roles building agents"
     """
-    from emplaiyed.sources.search_agent import agentic_search
-
     profile = try_load_profile()
     if not profile:
         console.print(
@@ -231,45 +368,41 @@ def search(
     def _progress(msg: str) -> None:
         console.print(f"  [dim]{msg}[/dim]")
 
-    db_conn = init_db(get_default_db_path())
-    try:
-        result = asyncio.run(
-            agentic_search(
-                profile, sources, direction=direction,
-                time_limit=time_limit,
-                db_conn=db_conn, on_progress=_progress,
-            )
-        )
+    with db_connection() as db_conn:
+        asyncio.run(_run_search(profile, sources, direction, time_limit, db_conn, _progress))
 
-        if not result.opportunities:
-            console.print("[yellow]No opportunities found.[/yellow]")
-            return
 
-        # Opportunities are already persisted as they're found by the agent.
-        console.print(
-            f"\n[green]{len(result.opportunities)} opportunities found "
-            f"and saved to database.[/green]"
-        )
-        console.print(f"[dim]Queries used: {len(result.queries_used)}[/dim]")
-        console.print(f"[dim]Summary: {result.summary}[/dim]")
-
-        # Score if possible
-        scored = _score_results(profile, result.opportunities, db_conn)
-        if scored:
-            asset_count = _eager_generate_assets(profile, scored, db_conn)
-            _show_scored_table("agentic", scored, db_conn, asset_count)
-        else:
-            console.print("\nRun [cyan]emplaiyed console[/cyan] to review.")
-    finally:
-        db_conn.close()
+async def _run_search(profile, sources, direction, time_limit, db_conn, on_progress) -> None:
+    """Run the agentic search, then score and generate on the same event loop."""
+    from emplaiyed.sources.search_agent import agentic_search
+
+    result = await agentic_search(
+        profile, sources, direction=direction,
+        time_limit=time_limit,
+        db_conn=db_conn, on_progress=on_progress,
+    )
+
+    if not result.opportunities:
+        console.print("[yellow]No opportunities found.[/yellow]")
+        return
+
+    # Opportunities are already persisted as they're found by the agent.
+    console.print(
+        f"\n[green]{len(result.opportunities)} opportunities found "
+        f"and saved to database.[/green]"
+    )
+    console.print(f"[dim]Queries used: {len(result.queries_used)}[/dim]")
+    console.print(f"[dim]Summary: {result.summary}[/dim]")
+
+    # Score if possible
+    scored = await _score_results(profile, result.opportunities, db_conn)
+    if scored:
+        asset_count = await _eager_generate_assets(profile, scored, db_conn)
+        _show_scored_table("agentic", scored, db_conn, asset_count)
+    else:
+        console.print("\nRun [cyan]emplaiyed console[/cyan] to review.")
 
 
 def _probe_source_status(source) -> str:
-    """Return a human-readable status for a source."""
-    try:
-        asyncio.run(source.scrape(SearchQuery()))
-        return "ready"
-    except NotImplementedError:
-        return "stub (not implemented)"
-    except Exception:
-        return "ready"
+    """Return a human-readable status for a source, without scraping it."""
+    return "ready" if source.implemented else "stub (not implemented)"
@@ -16,8 +16,10 @@ from emplaiyed.cli import (
     resolve_work_item,
 )
 from emplaiyed.core.database import (
-    get_application,
+    count_pending_work_items,
     get_opportunity,
+    get_opportunity_for_application,
+    iter_pending_work_summaries,
     list_pending_work_items,
 )
 from emplaiyed.core.models import ApplicationStatus, WorkStatus
@@ -31,10 +33,9 @@ work_app = typer.Typer(
 )
 
 
-def _format_age(item) -> str:
-    """Format time since creation as a human-readable string."""
-    delta = datetime.now() - item.created_at
-    minutes = int(delta.total_seconds() / 60)
+def _format_age(created_at: datetime, now: datetime) -> str:
+    """Format the time from *created_at* to *now* as a human-readable string."""
+    minutes = int((now - created_at).total_seconds()) // 60
     if minutes < 60:
         return f"{minutes} min"
     hours = minutes // 60
@@ -48,23 +49,24 @@ def _format_age(item) -> str:
 def list_command() -> None:
     """Show all pending work items."""
     with db_connection() as conn:
-        items = list_pending_work_items(conn)
-        if not items:
+        pending = count_pending_work_items(conn)
+        if not pending:
             console.print("[green]No pending work items. You're all caught up![/green]")
             return
 
-        table = Table(title=f"Work Queue ({len(items)} pending)")
+        table = Table(title=f"Work Queue ({pending} pending)")
         table.add_column("ID", style="dim")
         table.add_column("Type")
         table.add_column("Task")
         table.add_column("Age", justify="right")
 
-        for item in items:
+        now = datetime.now()
+        for item in iter_pending_work_summaries(conn):
             table.add_row(
                 item.id[:8] + "..",
-                item.work_type.value.lower(),
+                item.work_type.lower(),
                 item.title,
-                _format_age(item),
+                _format_age(datetime.fromisoformat(item.created_at), now),
             )
 
         console.print(table)
@@ -104,15 +106,14 @@ def done_command(
 
         completed = complete_work_item(conn, item.id)
 
-        app = get_application(conn, completed.application_id)
-        opp = get_opportunity(conn, app.opportunity_id) if app else None
+        opp = get_opportunity_for_application(conn, completed.application_id)
         company = opp.company if opp else "Unknown"
 
         console.print(
             f"[green]Done![/green] {company} application advanced to "
             f"{completed.target_status}."
         )
-        remaining = len(list_pending_work_items(conn))
+        remaining = count_pending_work_items(conn)
         console.print(f"{remaining} items remaining in your queue.")
 
 
@@ -129,15 +130,14 @@ def skip_command(
 
         skipped = skip_work_item(conn, item.id)
 
-        app = get_application(conn, skipped.application_id)
-        opp = get_opportunity(conn, app.opportunity_id) if app else None
+        opp = get_opportunity_for_application(conn, skipped.application_id)
         company = opp.company if opp else "Unknown"
 
         console.print(
             f"[yellow]Skipped.[/yellow] {company} application reverted to "
             f"{skipped.previous_status}."
         )
-        remaining = len(list_pending_work_items(conn))
+        remaining = count_pending_work_items(conn)
         console.print(f"{remaining} items remaining in your queue.")
 
 
@@ -165,8 +165,7 @@ def pass_command(
 
 def _display_work_item(conn, item) -> None:
     """Render a work item as a rich panel."""
-    app = get_application(conn, item.application_id)
-    opp = get_opportunity(conn, app.opportunity_id) if app else None
+    opp = get_opportunity_for_application(conn, item.application_id)
 
     lines = []
     if opp:
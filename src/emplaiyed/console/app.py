@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
+import sqlite3
 import subprocess
 import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -13,22 +18,33 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
-from textual.widgets import Footer, Header, OptionList, Static, TabbedContent, TabPane
+from textual.widgets import (
+    Footer,
+    Header,
+    OptionList,
+    Static,
+    Tab,
+    TabbedContent,
+    TabPane,
+)
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
 from emplaiyed.console.funnel_stats import compute_funnel
-from emplaiyed.console.stages import STAGE_GROUPS, STAGE_TAB_ORDER
+from emplaiyed.console.stages import STAGE_GROUPS, STAGE_TAB_ORDER, tab_for_status
 from emplaiyed.core.database import (
     delete_application,
     get_application,
     get_default_db_path,
+    get_opportunities_many,
     get_opportunity,
+    get_pending_work_item_for_application,
     init_db,
+    list_all_status_transitions,
     list_applications,
     list_applications_by_statuses,
     list_events,
     list_interactions,
-    list_pending_work_items,
     list_status_transitions,
     reclassify_threshold_apps,
     save_event,
@@ -39,7 +55,9 @@ from emplaiyed.core.models import (
     ApplicationStatus,
     Interaction,
     InteractionType,
+    Opportunity,
     ScheduledEvent,
+    StatusTransition,
     WorkType,
 )
 from emplaiyed.generation.pipeline import get_asset_dir, has_assets
@@ -49,6 +67,15 @@ from emplaiyed.work.queue import complete_work_item, create_work_item, skip_work
 # Tab ID mappings
 _TAB_IDS = {name: f"tab-{name.lower()}" for name in STAGE_TAB_ORDER}
 _ID_TO_TAB = {v: k for k, v in _TAB_IDS.items()}
+# Neighbouring tabs for left/right cycling (wraps around)
+_NEXT_TAB = dict(zip(STAGE_TAB_ORDER, STAGE_TAB_ORDER[1:] + STAGE_TAB_ORDER[:1]))
+_PREV_TAB = {nxt: cur for cur, nxt in _NEXT_TAB.items()}
+# Widget IDs inside each tab (Funnel has no list)
+_LIST_IDS = {
+    name: f"list-{name.lower()}" for name in STAGE_TAB_ORDER if name != "Funnel"
+}
+_DETAIL_IDS = {name: f"detail-{name.lower()}" for name in STAGE_TAB_ORDER}
+_LIST_ID_TO_TAB = {v: k for k, v in _LIST_IDS.items()}
 
 # Actions valid per tab
 _TAB_ACTIONS: dict[str, set[str]] = {
@@ -103,6 +130,17 @@ _TAB_ACTIONS: dict[str, set[str]] = {
 }
 
 _ALWAYS_VALID = {"prev_tab", "next_tab", "quit", "search"}
+# Everything check_action allows on each tab
+_VALID_ACTIONS: dict[str, frozenset[str]] = {
+    tab: frozenset(actions | _ALWAYS_VALID) for tab, actions in _TAB_ACTIONS.items()
+}
+
+# Concurrent background asset generations (each one is an LLM call + PDF render).
+_ASSET_CONCURRENCY = 4
+
+
+def _truncate(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 3] + "..."
 
 
 class WorkConsoleApp(App):
@@ -165,29 +203,59 @@ class WorkConsoleApp(App):
         self._conn = None
         self._queue_apps: list[Application] = []
         self._tab_apps: dict[str, list[Application]] = {}
+        # Application ids currently listed in each pipeline tab's OptionList.
+        self._tab_app_ids: dict[str, list[str]] = {}
+        # Opportunities behind the listed apps, filled on refresh so moving
+        # the cursor renders details without a query.
+        self._opp_cache: dict[str, Opportunity] = {}
+        # "Company — Title" option labels by opportunity id.  Both caches are
+        # reset on every full or deferred refresh (see _reset_caches).
+        self._label_cache: dict[str, str] = {}
         self._generating: set[str] = set()
+        self._assets_sem = asyncio.Semaphore(_ASSET_CONCURRENCY)
+        # has_assets() results by app id, filled as details are first shown;
+        # reset on every queue rebuild so assets written elsewhere show up.
+        self._assets_ready: dict[str, bool] = {}
         self._closing = False
         self._show_below_threshold = False
+        # Tabs to rebuild on the next deferred refresh (see _refresh_after_action).
+        self._stale_tabs: set[str] = set()
+        self._refresh_pending = False
+        # Resolved per-tab widgets, so hot paths skip the selector lookup.
+        self._list_widgets: dict[str, OptionList] = {}
+        self._tc: TabbedContent | None = None
+        self._active_valid = _VALID_ACTIONS["Queue"]
+        self._tabs: dict[str, Tab] = {}
+        self._detail_widgets: dict[str, Static] = {}
+        # Text last written to each detail pane (see _set_detail).
+        self._last_detail: dict[str, str] = {}
+        # Reader connection for the funnel worker thread (see _refresh_funnel_bg).
+        self._funnel_conn: sqlite3.Connection | None = None
+        self._funnel_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
         yield Header()
         with TabbedContent(id="main-tabs"):
             for tab_name in STAGE_TAB_ORDER:
-                tab_key = tab_name.lower()
+                detail_id = _DETAIL_IDS[tab_name]
                 with TabPane(tab_name, id=_TAB_IDS[tab_name]):
                     if tab_name == "Funnel":
-                        yield Static("", id=f"detail-{tab_key}", classes="tab-detail")
+                        yield Static("", id=detail_id, classes="tab-detail")
                     else:
                         with Horizontal(classes="tab-content"):
-                            yield OptionList(id=f"list-{tab_key}", classes="tab-list")
-                            yield Static(
-                                "", id=f"detail-{tab_key}", classes="tab-detail"
+                            yield OptionList(
+                                id=_LIST_IDS[tab_name], classes="tab-list"
                             )
+                            yield Static("", id=detail_id, classes="tab-detail")
         yield Footer()
 
     def on_mount(self) -> None:
         path = self._db_path or get_default_db_path()
         self._conn = init_db(path)
+        self._tc = self.query_one(TabbedContent)
+        self._tabs = {
+            name: self._tc.get_tab(_TAB_IDS[name]) for name in STAGE_TAB_ORDER
+        }
         self._refresh_all()
 
     def on_unmount(self) -> None:
@@ -196,18 +264,82 @@ class WorkConsoleApp(App):
         if self._conn:
             self._conn.close()
             self._conn = None
+        with self._funnel_lock:
+            if self._funnel_conn is not None:
+                self._funnel_conn.close()
+                self._funnel_conn = None
 
     # ------------------------------------------------------------------
     # Refresh
     # ------------------------------------------------------------------
 
+    def _reset_caches(self) -> None:
+        """Drop cached opportunities and labels so edits show on the next rebuild."""
+        self._opp_cache.clear()
+        self._label_cache.clear()
+
     def _refresh_all(self) -> None:
+        self._reset_caches()
         self._refresh_queue()
         for tab_name in STAGE_GROUPS:
             self._refresh_pipeline_tab(tab_name)
         self._refresh_funnel()
         self._update_tab_labels()
 
+    def _refresh_tab(self, tab_name: str) -> None:
+        if tab_name == "Queue":
+            self._refresh_queue()
+        elif tab_name == "Funnel":
+            self._refresh_funnel()
+        else:
+            self._refresh_pipeline_tab(tab_name)
+
+    def _refresh_tabs(self, names: set[str]) -> None:
+        for tab_name in STAGE_TAB_ORDER:
+            if tab_name in names:
+                self._refresh_tab(tab_name)
+
+    @staticmethod
+    def _affected_tabs(*statuses: ApplicationStatus) -> set[str]:
+        """Tabs listing any of *statuses*, plus the Funnel (transitions changed)."""
+        tabs = {tab_for_status(s) for s in statuses}
+        tabs.discard(None)
+        tabs.add("Funnel")
+        return tabs
+
+    def _refresh_after_action(self, tabs: set[str] | None = None) -> None:
+        """Refresh the visible tab now; coalesce the others into one deferred pass.
+
+        *tabs* names the tabs the action touched (usually the source and
+        destination stage plus the Funnel, see :meth:`_affected_tabs`);
+        ``None`` means every tab.  The active list must be current before
+        the next keypress acts on it.  The rest can wait ~50ms, so a burst
+        of actions (d, d, d) rebuilds them once instead of per key.
+        """
+        if tabs is None:
+            tabs = set(STAGE_TAB_ORDER)
+        active = self._active_tab
+        if active in tabs:
+            self._refresh_tab(active)
+            # Already current: the deferred pass must not rebuild it (and
+            # reset its cursor) again.
+            tabs = tabs - {active}
+            self._stale_tabs.discard(active)
+        self._update_tab_labels()
+        self._stale_tabs.update(tabs)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(0.05, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_pending = False
+        if self._closing or self._conn is None:
+            return
+        stale, self._stale_tabs = self._stale_tabs, set()
+        self._reset_caches()
+        self._refresh_tabs(stale)
+        self._update_tab_labels()
+
     def _refresh_queue(self) -> None:
         from emplaiyed.llm.config import SCORE_THRESHOLD
 
@@ -223,17 +355,20 @@ class WorkConsoleApp(App):
             queue_statuses.append(ApplicationStatus.BELOW_THRESHOLD)
         self._queue_apps = list_applications_by_statuses(self._conn, queue_statuses)
         self._queue_apps.sort(key=lambda a: a.score or 0, reverse=True)
-        option_list = self.query_one("#list-queue", OptionList)
+        self._assets_ready.clear()
+        option_list = self._list_widget("Queue")
         option_list.clear_options()
         if not self._queue_apps:
             self.sub_title = "0 pending"
-            detail = self.query_one("#detail-queue", Static)
-            detail.update("All caught up! No pending work items.")
+            self._set_detail("Queue", "All caught up! No pending work items.")
             return
         self.sub_title = f"{len(self._queue_apps)} pending"
+        opps = get_opportunities_many(
+            self._conn, {a.opportunity_id for a in self._queue_apps}
+        )
+        self._opp_cache.update(opps)
         for app in self._queue_apps:
-            opp = get_opportunity(self._conn, app.opportunity_id)
-            label = f"{opp.company} — {opp.title}" if opp else app.id
+            label = self._option_label(app, opps)
             if app.status == ApplicationStatus.BELOW_THRESHOLD:
                 label = f"[BT] {label}"
             option_list.add_option(Option(label, id=app.id))
@@ -244,31 +379,54 @@ class WorkConsoleApp(App):
         statuses = STAGE_GROUPS[tab_name]
         apps = list_applications_by_statuses(self._conn, statuses)
         self._tab_apps[tab_name] = apps
-        tab_key = tab_name.lower()
         try:
-            option_list = self.query_one(f"#list-{tab_key}", OptionList)
+            option_list = self._list_widget(tab_name)
         except Exception:
             return  # tab content not yet mounted
+        app_ids = [a.id for a in apps]
+        if app_ids == self._tab_app_ids.get(tab_name):
+            # Same rows as last time: keep the list (and cursor), redo the detail.
+            if apps:
+                self._show_pipeline_detail(tab_name, option_list.highlighted or 0)
+            return
+        self._tab_app_ids[tab_name] = app_ids
         option_list.clear_options()
         if not apps:
             try:
-                detail = self.query_one(f"#detail-{tab_key}", Static)
-                detail.update(f"No applications in {tab_name} stage.")
+                self._set_detail(tab_name, f"No applications in {tab_name} stage.")
             except Exception:
                 pass
             return
+        opps = get_opportunities_many(self._conn, {a.opportunity_id for a in apps})
+        self._opp_cache.update(opps)
         for app in apps:
-            opp = get_opportunity(self._conn, app.opportunity_id)
-            label = f"{opp.company} — {opp.title}" if opp else app.id
-            option_list.add_option(Option(label, id=app.id))
+            option_list.add_option(Option(self._option_label(app, opps), id=app.id))
         option_list.highlighted = 0
         self._show_pipeline_detail(tab_name, 0)
 
     def _refresh_funnel(self) -> None:
-        all_apps = list_applications(self._conn)
-        all_transitions: list = []
-        for app in all_apps:
-            all_transitions.extend(list_status_transitions(self._conn, app.id))
+        self._refresh_funnel_bg(self._db_path or get_default_db_path())
+
+    @work(thread=True, exclusive=True, group="funnel")
+    def _refresh_funnel_bg(self, db_path: Path) -> None:
+        """Scan the whole history in a thread; only the text update runs on the UI."""
+        # Each worker runs on a fresh thread, so one reader connection is
+        # shared across them under a lock rather than opened per refresh.
+        with self._funnel_lock:
+            if self._closing:
+                return
+            if self._funnel_conn is None:
+                self._funnel_conn = init_db(db_path, check_same_thread=False)
+            all_apps = list_applications(self._funnel_conn)
+            all_transitions = list_all_status_transitions(self._funnel_conn)
+        text = self._format_funnel(all_apps, all_transitions)
+        if not self._closing and not get_current_worker().is_cancelled:
+            self.call_from_thread(self._set_detail, "Funnel", text)
+
+    @staticmethod
+    def _format_funnel(
+        all_apps: list[Application], all_transitions: list[StatusTransition]
+    ) -> str:
         snapshot = compute_funnel(all_apps, all_transitions)
 
         lines = ["FUNNEL DASHBOARD", "=" * 40, ""]
@@ -305,21 +463,18 @@ class WorkConsoleApp(App):
             ]
         )
 
-        detail = self.query_one("#detail-funnel", Static)
-        detail.update("\n".join(lines))
+        return "\n".join(lines)
 
     def _update_tab_labels(self) -> None:
-        try:
-            tc = self.query_one(TabbedContent)
-        except Exception:
+        if not self._tabs:
             return
         queue_count = len(self._queue_apps)
         bt_suffix = " +BT" if self._show_below_threshold else ""
-        tc.get_tab(_TAB_IDS["Queue"]).label = f"Queue ({queue_count}{bt_suffix})"
+        self._tabs["Queue"].label = f"Queue ({queue_count}{bt_suffix})"
         for tab_name in STAGE_GROUPS:
             count = len(self._tab_apps.get(tab_name, []))
-            tc.get_tab(_TAB_IDS[tab_name]).label = f"{tab_name} ({count})"
-        tc.get_tab(_TAB_IDS["Funnel"]).label = "Funnel"
+            self._tabs[tab_name].label = f"{tab_name} ({count})"
+        self._tabs["Funnel"].label = "Funnel"
 
     # ------------------------------------------------------------------
     # Detail rendering
@@ -329,7 +484,7 @@ class WorkConsoleApp(App):
         if idx >= len(self._queue_apps):
             return
         app = self._queue_apps[idx]
-        opp = get_opportunity(self._conn, app.opportunity_id)
+        opp = self._get_opportunity(app.opportunity_id)
 
         lines: list[str] = []
         if opp:
@@ -361,22 +516,21 @@ class WorkConsoleApp(App):
             lines.append(app.why_it_fits)
             lines.append("")
 
-        if has_assets(app.id):
+        if self._has_assets(app.id):
             lines.append("Assets: Ready (o to open)")
         elif app.id in self._generating:
             lines.append("Assets: Generating...")
         else:
             lines.append("Assets: Not generated (g to generate)")
 
-        detail = self.query_one("#detail-queue", Static)
-        detail.update("\n".join(lines))
+        self._set_detail("Queue", "\n".join(lines))
 
     def _show_pipeline_detail(self, tab_name: str, idx: int) -> None:
         apps = self._tab_apps.get(tab_name, [])
         if idx >= len(apps):
             return
         app = apps[idx]
-        opp = get_opportunity(self._conn, app.opportunity_id)
+        opp = self._get_opportunity(app.opportunity_id)
 
         lines: list[str] = []
         if opp:
@@ -411,57 +565,100 @@ class WorkConsoleApp(App):
         lines.append("TIMELINE")
         lines.append("")
 
-        timeline_entries: list[tuple[datetime, str]] = []
-
-        for t in list_status_transitions(self._conn, app.id):
-            timeline_entries.append(
-                (t.transitioned_at, f"{t.from_status} → {t.to_status}")
-            )
-
-        for ix in list_interactions(self._conn, app.id):
-            label = ix.content or ""
-            if len(label) > 60:
-                label = label[:57] + "..."
-            timeline_entries.append((ix.created_at, f"[{ix.type.value}] {label}"))
-
-        for ev in list_events(self._conn, application_id=app.id):
-            label = ev.notes or ""
-            if len(label) > 60:
-                label = label[:57] + "..."
-            timeline_entries.append(
-                (ev.scheduled_date, f"[EVENT] {ev.event_type} — {label}")
+        # Each query is already ordered by its timestamp, so merge rather than sort.
+        transitions = (
+            (t.transitioned_at, f"{t.from_status} → {t.to_status}")
+            for t in list_status_transitions(self._conn, app.id)
+        )
+        interactions = (
+            (ix.created_at, f"[{ix.type.value}] {_truncate(ix.content or '', 60)}")
+            for ix in list_interactions(self._conn, app.id)
+        )
+        events = (
+            (
+                ev.scheduled_date,
+                f"[EVENT] {ev.event_type} — {_truncate(ev.notes or '', 60)}",
             )
+            for ev in list_events(self._conn, application_id=app.id)
+        )
 
-        timeline_entries.sort(key=lambda e: e[0])
-
-        if timeline_entries:
-            for ts, desc in timeline_entries:
-                lines.append(f"  {ts.strftime('%b %d %H:%M')}  {desc}")
-        else:
+        empty = True
+        for ts, desc in heapq.merge(
+            transitions, interactions, events, key=lambda e: e[0]
+        ):
+            empty = False
+            lines.append(f"  {ts.strftime('%b %d %H:%M')}  {desc}")
+        if empty:
             lines.append("  (no activity recorded)")
 
         try:
-            detail = self.query_one(f"#detail-{tab_name.lower()}", Static)
+            self._set_detail(tab_name, "\n".join(lines))
         except Exception:
             return  # tab content not yet mounted
-        detail.update("\n".join(lines))
 
     # ------------------------------------------------------------------
     # Data helpers
     # ------------------------------------------------------------------
 
+    def _get_opportunity(self, opportunity_id: str) -> Opportunity | None:
+        """Return an opportunity from the refresh cache, querying on a miss."""
+        opp = self._opp_cache.get(opportunity_id)
+        if opp is None:
+            opp = get_opportunity(self._conn, opportunity_id)
+            if opp is not None:
+                self._opp_cache[opportunity_id] = opp
+        return opp
+
+    def _has_assets(self, app_id: str) -> bool:
+        """Return whether an app's CV and letter exist, checking disk once per app."""
+        ready = self._assets_ready.get(app_id)
+        if ready is None:
+            ready = self._assets_ready[app_id] = has_assets(app_id)
+        return ready
+
+    def _option_label(
+        self, app: Application, opps: dict[str, Opportunity]
+    ) -> str:
+        label = self._label_cache.get(app.opportunity_id)
+        if label is None:
+            opp = opps.get(app.opportunity_id)
+            if opp is None:
+                return app.id
+            label = f"{opp.company} — {opp.title}"
+            self._label_cache[app.opportunity_id] = label
+        return label
+
+    def _list_widget(self, tab_name: str) -> OptionList:
+        widget = self._list_widgets.get(tab_name)
+        if widget is None:
+            widget = self.query_one(f"#{_LIST_IDS[tab_name]}", OptionList)
+            self._list_widgets[tab_name] = widget
+        return widget
+
+    def _detail_widget(self, tab_name: str) -> Static:
+        widget = self._detail_widgets.get(tab_name)
+        if widget is None:
+            widget = self.query_one(f"#{_DETAIL_IDS[tab_name]}", Static)
+            self._detail_widgets[tab_name] = widget
+        return widget
+
+    def _set_detail(self, tab_name: str, text: str) -> None:
+        """Update a detail pane, skipping the re-layout when the text is unchanged."""
+        if self._last_detail.get(tab_name) == text:
+            return
+        self._detail_widget(tab_name).update(text)
+        self._last_detail[tab_name] = text
+
     @property
     def _active_tab(self) -> str:
-        try:
-            tc = self.query_one(TabbedContent)
-            return _ID_TO_TAB.get(tc.active, "Queue")
-        except Exception:
+        if self._tc is None:
             return "Queue"
+        return _ID_TO_TAB.get(self._tc.active, "Queue")
 
     def _current_queue_app(self) -> Application | None:
         if self._active_tab != "Queue":
             return None
-        option_list = self.query_one("#list-queue", OptionList)
+        option_list = self._list_widget("Queue")
         idx = option_list.highlighted
         if idx is not None and 0 <= idx < len(self._queue_apps):
             return self._queue_apps[idx]
@@ -472,7 +669,7 @@ class WorkConsoleApp(App):
         if tab in ("Queue", "Funnel"):
             return None
         apps = self._tab_apps.get(tab, [])
-        option_list = self.query_one(f"#list-{tab.lower()}", OptionList)
+        option_list = self._list_widget(tab)
         idx = option_list.highlighted
         if idx is not None and 0 <= idx < len(apps):
             return apps[idx]
@@ -485,15 +682,7 @@ class WorkConsoleApp(App):
     def on_option_list_option_highlighted(
         self, event: OptionList.OptionHighlighted
     ) -> None:
-        list_id = event.option_list.id
-        if not list_id or not list_id.startswith("list-"):
-            return
-        tab_key = list_id[5:]  # strip "list-"
-        tab_name = None
-        for name in STAGE_TAB_ORDER:
-            if name.lower() == tab_key:
-                tab_name = name
-                break
+        tab_name = _LIST_ID_TO_TAB.get(event.option_list.id or "")
         if tab_name is None:
             return
         idx = event.option_index
@@ -510,14 +699,12 @@ class WorkConsoleApp(App):
     def on_tabbed_content_tab_activated(
         self, event: TabbedContent.TabActivated
     ) -> None:
+        self._active_valid = _VALID_ACTIONS[self._active_tab]
         self.refresh_bindings()
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
-        if action in _ALWAYS_VALID:
-            return True
-        tab = self._active_tab
-        valid = _TAB_ACTIONS.get(tab, set())
-        return action in valid
+        # Called for every binding on every key; the set tracks tab activation.
+        return action in self._active_valid
 
     # ------------------------------------------------------------------
     # Navigation actions
@@ -527,29 +714,19 @@ class WorkConsoleApp(App):
         tab = self._active_tab
         if tab == "Funnel":
             return
-        option_list = self.query_one(f"#list-{tab.lower()}", OptionList)
-        option_list.action_cursor_down()
+        self._list_widget(tab).action_cursor_down()
 
     def action_cursor_up(self) -> None:
         tab = self._active_tab
         if tab == "Funnel":
             return
-        option_list = self.query_one(f"#list-{tab.lower()}", OptionList)
-        option_list.action_cursor_up()
+        self._list_widget(tab).action_cursor_up()
 
     def action_prev_tab(self) -> None:
-        current = self._active_tab
-        idx = STAGE_TAB_ORDER.index(current)
-        prev_idx = (idx - 1) % len(STAGE_TAB_ORDER)
-        tc = self.query_one(TabbedContent)
-        tc.active = _TAB_IDS[STAGE_TAB_ORDER[prev_idx]]
+        self._tc.active = _TAB_IDS[_PREV_TAB[self._active_tab]]
 
     def action_next_tab(self) -> None:
-        current = self._active_tab
-        idx = STAGE_TAB_ORDER.index(current)
-        next_idx = (idx + 1) % len(STAGE_TAB_ORDER)
-        tc = self.query_one(TabbedContent)
-        tc.active = _TAB_IDS[STAGE_TAB_ORDER[next_idx]]
+        self._tc.active = _TAB_IDS[_NEXT_TAB[self._active_tab]]
 
     # ------------------------------------------------------------------
     # Search
@@ -576,26 +753,12 @@ class WorkConsoleApp(App):
             return
 
         # Determine which tab the app lives in
-        queue_statuses = {
-            ApplicationStatus.SCORED,
-            ApplicationStatus.OUTREACH_PENDING,
-            ApplicationStatus.FOLLOW_UP_PENDING,
-            ApplicationStatus.BELOW_THRESHOLD,
-        }
-        if app.status in queue_statuses:
-            target_tab = "Queue"
-        else:
-            target_tab = None
-            for tab_name, statuses in STAGE_GROUPS.items():
-                if app.status in statuses:
-                    target_tab = tab_name
-                    break
-            if target_tab is None:
-                return
+        target_tab = tab_for_status(app.status)
+        if target_tab is None:
+            return
 
         # Switch tab
-        tc = self.query_one(TabbedContent)
-        tc.active = _TAB_IDS[target_tab]
+        self._tc.active = _TAB_IDS[target_tab]
 
         # Refresh the tab to ensure the app is in the list
         if target_tab == "Queue":
@@ -606,12 +769,10 @@ class WorkConsoleApp(App):
             apps = self._tab_apps.get(target_tab, [])
 
         # Find the app's index and highlight it
-        tab_key = target_tab.lower()
         for idx, a in enumerate(apps):
             if a.id == app_id:
                 try:
-                    option_list = self.query_one(f"#list-{tab_key}", OptionList)
-                    option_list.highlighted = idx
+                    self._list_widget(target_tab).highlighted = idx
                 except Exception:
                     pass
                 break
@@ -628,11 +789,9 @@ class WorkConsoleApp(App):
             return
         if app.status == ApplicationStatus.OUTREACH_PENDING:
             # Already has a work item — find and complete it
-            pending = list_pending_work_items(self._conn)
-            for wi in pending:
-                if wi.application_id == app.id:
-                    complete_work_item(self._conn, wi.id)
-                    break
+            wi = get_pending_work_item_for_application(self._conn, app.id)
+            if wi is not None:
+                complete_work_item(self._conn, wi.id)
         elif app.status in (
             ApplicationStatus.SCORED,
             ApplicationStatus.BELOW_THRESHOLD,
@@ -659,7 +818,9 @@ class WorkConsoleApp(App):
                 pending_status=ApplicationStatus.OUTREACH_PENDING,
             )
             complete_work_item(self._conn, wi.id)
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.OUTREACH_SENT)
+        )
 
     def action_mark_passed(self) -> None:
         if self._active_tab != "Queue":
@@ -669,11 +830,9 @@ class WorkConsoleApp(App):
             return
         if app.status == ApplicationStatus.OUTREACH_PENDING:
             # Has a work item — skip it, then transition to PASSED
-            pending = list_pending_work_items(self._conn)
-            for wi in pending:
-                if wi.application_id == app.id:
-                    skip_work_item(self._conn, wi.id)
-                    break
+            wi = get_pending_work_item_for_application(self._conn, app.id)
+            if wi is not None:
+                skip_work_item(self._conn, wi.id)
             refreshed = get_application(self._conn, app.id)
             if refreshed and can_transition(refreshed.status, ApplicationStatus.PASSED):
                 transition(self._conn, app.id, ApplicationStatus.PASSED)
@@ -683,7 +842,9 @@ class WorkConsoleApp(App):
         ):
             # No work item — transition directly to PASSED
             transition(self._conn, app.id, ApplicationStatus.PASSED)
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.PASSED)
+        )
 
     def action_toggle_below_threshold(self) -> None:
         """Toggle visibility of below-threshold opportunities in the Queue."""
@@ -692,7 +853,7 @@ class WorkConsoleApp(App):
         self._show_below_threshold = not self._show_below_threshold
         label = "showing" if self._show_below_threshold else "hidden"
         self.notify(f"Below-threshold items: {label}")
-        self._refresh_all()
+        self._refresh_after_action({"Queue"})
 
     def action_delete_application(self) -> None:
         """Delete the selected application, its related data, and assets."""
@@ -709,8 +870,9 @@ class WorkConsoleApp(App):
         if asset_dir.exists():
             shutil.rmtree(asset_dir)
         delete_application(self._conn, app.id)
+        self._assets_ready.pop(app.id, None)
         self.notify(f"Deleted: {company} — {title}")
-        self._refresh_all()
+        self._refresh_after_action(self._affected_tabs(app.status))
 
     def action_open_assets(self) -> None:
         if self._active_tab != "Queue":
@@ -718,7 +880,7 @@ class WorkConsoleApp(App):
         app = self._current_queue_app()
         if app is None:
             return
-        if not has_assets(app.id):
+        if not self._has_assets(app.id):
             return
         asset_dir = get_asset_dir(app.id)
         if sys.platform == "darwin":
@@ -732,7 +894,7 @@ class WorkConsoleApp(App):
         app = self._current_queue_app()
         if app is None:
             return
-        if has_assets(app.id):
+        if self._has_assets(app.id):
             self.notify("Assets already generated")
             return
         if app.id in self._generating:
@@ -740,7 +902,7 @@ class WorkConsoleApp(App):
             return
         self._trigger_asset_generation(app.id)
         self._show_queue_detail(
-            self.query_one("#list-queue", OptionList).highlighted or 0
+            self._list_widget("Queue").highlighted or 0
         )
 
     # ------------------------------------------------------------------
@@ -755,11 +917,11 @@ class WorkConsoleApp(App):
         if tab == "Queue":
             queue_app = self._current_queue_app()
             if queue_app:
-                opp = get_opportunity(self._conn, queue_app.opportunity_id)
+                opp = self._get_opportunity(queue_app.opportunity_id)
         else:
             app = self._current_pipeline_app()
             if app:
-                opp = get_opportunity(self._conn, app.opportunity_id)
+                opp = self._get_opportunity(app.opportunity_id)
         if opp is None or not opp.source_url:
             return
         import webbrowser
@@ -854,7 +1016,7 @@ class WorkConsoleApp(App):
             )
             transition(self._conn, app.id, target)
             self.notify("Follow-up logged")
-            self._refresh_all()
+            self._refresh_after_action(self._affected_tabs(app.status, target))
 
         self.push_screen(LogFollowUpModal(), callback=_on_followup)
 
@@ -905,7 +1067,13 @@ class WorkConsoleApp(App):
                         self._conn, app.id, ApplicationStatus.INTERVIEW_SCHEDULED
                     )
             self.notify("Marked as response received")
-            self._refresh_all()
+            self._refresh_after_action(
+                self._affected_tabs(
+                    app.status,
+                    ApplicationStatus.RESPONSE_RECEIVED,
+                    ApplicationStatus.INTERVIEW_SCHEDULED,
+                )
+            )
 
         self.push_screen(ResponseReceivedModal(), callback=_on_response)
 
@@ -920,7 +1088,9 @@ class WorkConsoleApp(App):
             return
         transition(self._conn, app.id, ApplicationStatus.GHOSTED)
         self.notify("Marked as ghosted")
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.GHOSTED)
+        )
 
     def action_schedule_interview(self) -> None:
         if self._active_tab != "Active":
@@ -946,7 +1116,9 @@ class WorkConsoleApp(App):
             if can_transition(app.status, ApplicationStatus.INTERVIEW_SCHEDULED):
                 transition(self._conn, app.id, ApplicationStatus.INTERVIEW_SCHEDULED)
             self.notify("Interview scheduled")
-            self._refresh_all()
+            self._refresh_after_action(
+                self._affected_tabs(app.status, ApplicationStatus.INTERVIEW_SCHEDULED)
+            )
 
         self.push_screen(ScheduleInterviewModal(), callback=_on_schedule)
 
@@ -961,7 +1133,9 @@ class WorkConsoleApp(App):
             return
         transition(self._conn, app.id, ApplicationStatus.INTERVIEW_COMPLETED)
         self.notify("Interview completed")
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.INTERVIEW_COMPLETED)
+        )
 
     def action_mark_rejected(self) -> None:
         tab = self._active_tab
@@ -975,7 +1149,9 @@ class WorkConsoleApp(App):
             return
         transition(self._conn, app.id, ApplicationStatus.REJECTED)
         self.notify("Marked as rejected")
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.REJECTED)
+        )
 
     def action_mark_offer(self) -> None:
         if self._active_tab != "Active":
@@ -1007,7 +1183,9 @@ class WorkConsoleApp(App):
             )
             transition(self._conn, app.id, ApplicationStatus.OFFER_RECEIVED)
             self.notify("Offer recorded")
-            self._refresh_all()
+            self._refresh_after_action(
+                self._affected_tabs(app.status, ApplicationStatus.OFFER_RECEIVED)
+            )
 
         self.push_screen(NoteModal(), callback=_on_offer)
 
@@ -1022,46 +1200,52 @@ class WorkConsoleApp(App):
             return
         transition(self._conn, app.id, ApplicationStatus.ACCEPTED)
         self.notify("Offer accepted!")
-        self._refresh_all()
+        self._refresh_after_action(
+            self._affected_tabs(app.status, ApplicationStatus.ACCEPTED)
+        )
 
     # ------------------------------------------------------------------
     # Asset generation (background)
     # ------------------------------------------------------------------
 
     def _trigger_asset_generation(self, app_id: str) -> None:
-        if app_id in self._generating:
+        if app_id in self._generating or self._has_assets(app_id):
             return
         self._generating.add(app_id)
         self._generate_assets_bg(app_id)
 
-    @work(exclusive=False)
+    @work(exclusive=False, group="assets")
     async def _generate_assets_bg(self, app_id: str) -> None:
         from emplaiyed.core.profile_store import get_default_profile_path, load_profile
         from emplaiyed.generation.pipeline import generate_assets
 
         try:
-            app = get_application(self._conn, app_id)
-            if app is None:
-                return
-            opp = get_opportunity(self._conn, app.opportunity_id)
-            if opp is None:
-                return
-            profile_path = get_default_profile_path()
-            if not profile_path.exists():
-                return
-            profile = load_profile(profile_path)
-            await generate_assets(profile, opp, app_id)
-            self._refresh_current_queue_detail()
+            # Extra requests queue here instead of all hitting the LLM at once.
+            async with self._assets_sem:
+                app = get_application(self._conn, app_id)
+                if app is None:
+                    return
+                opp = get_opportunity(self._conn, app.opportunity_id)
+                if opp is None:
+                    return
+                profile_path = get_default_profile_path()
+                if not profile_path.exists():
+                    return
+                profile = load_profile(profile_path)
+                await generate_assets(profile, opp, app_id)
         except Exception:
             if not self._closing:
                 logger.warning("Asset generation failed for %s", app_id, exc_info=True)
         finally:
             self._generating.discard(app_id)
+            self._assets_ready.pop(app_id, None)
+        if not self._closing:
+            self._refresh_current_queue_detail()
 
     def _refresh_current_queue_detail(self) -> None:
         if self._active_tab != "Queue":
             return
-        option_list = self.query_one("#list-queue", OptionList)
+        option_list = self._list_widget("Queue")
         idx = option_list.highlighted
         if idx is not None and 0 <= idx < len(self._queue_apps):
             self._show_queue_detail(idx)
@@ -33,3 +33,21 @@ STAGE_GROUPS: dict[str, list[ApplicationStatus]] = {
 
 # Ordered tab names (Queue and Funnel are special, not status-filtered)
 STAGE_TAB_ORDER: list[str] = ["Queue", "Applied", "Active", "Offers", "Closed", "Funnel"]
+
+# Statuses listed in the Queue tab (BELOW_THRESHOLD only when toggled on).
+QUEUE_STATUSES: frozenset[ApplicationStatus] = frozenset({
+    ApplicationStatus.SCORED,
+    ApplicationStatus.OUTREACH_PENDING,
+    ApplicationStatus.FOLLOW_UP_PENDING,
+    ApplicationStatus.BELOW_THRESHOLD,
+})
+
+
+def tab_for_status(status: ApplicationStatus) -> str | None:
+    """Return the console tab that lists applications in *status*, if any."""
+    if status in QUEUE_STATUSES:
+        return "Queue"
+    for tab_name, statuses in STAGE_GROUPS.items():
+        if status in statuses:
+            return tab_name
+    return None
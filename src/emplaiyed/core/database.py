@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import zlib
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, NamedTuple
 
 from emplaiyed.core.models import (
     Application,
@@ -149,6 +151,31 @@ _POST_MIGRATIONS = [
         processed_at    TEXT NOT NULL
     )
     """,
+    # Listings filter by status and sort by recency; these let SQLite walk
+    # the rows already ordered instead of sorting the whole table.
+    """
+    CREATE INDEX IF NOT EXISTS idx_applications_status_updated
+    ON applications(status, updated_at)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_applications_updated
+    ON applications(updated_at)
+    """,
+    # Upcoming-event listings range-scan and sort on the scheduled date.
+    """
+    CREATE INDEX IF NOT EXISTS idx_events_scheduled_date
+    ON scheduled_events(scheduled_date)
+    """,
+    # Lets "which applications already have work" be answered from the index.
+    """
+    CREATE INDEX IF NOT EXISTS idx_work_items_application
+    ON work_items(application_id)
+    """,
+    # Per-application timelines read history in order.
+    """
+    CREATE INDEX IF NOT EXISTS idx_status_history_application
+    ON status_history(application_id, transitioned_at)
+    """,
     # Full-text search index on opportunities for quick keyword lookup.
     """
     CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts
@@ -185,33 +212,119 @@ def _json_loads(s: str | None) -> Any | None:
     return json.loads(s) if s else None
 
 
+def _prefix_range(prefix: str) -> tuple[str, str | None]:
+    """Return the ``[lower, upper)`` bounds matching every string starting with *prefix*.
+
+    This is the ``LIKE 'x%'`` → range rewrite: it lets SQLite walk the
+    primary-key index instead of scanning the table.  The upper bound is
+    ``None`` when *prefix* is empty (everything matches).
+    """
+    if not prefix:
+        return prefix, None
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _select_by_id_prefix(
+    conn: sqlite3.Connection, table: str, prefix: str, limit: int
+) -> list[sqlite3.Row]:
+    lower, upper = _prefix_range(prefix)
+    if upper is None:
+        cur = conn.execute(
+            f"SELECT * FROM {table} WHERE id >= ? ORDER BY id LIMIT ?", (lower, limit)
+        )
+    else:
+        cur = conn.execute(
+            f"SELECT * FROM {table} WHERE id >= ? AND id < ? ORDER BY id LIMIT ?",
+            (lower, upper, limit),
+        )
+    return cur.fetchall()
+
+
+# Stay well under SQLite's bound-parameter limit (999 on older builds).
+_IN_CHUNK = 900
+
+
+def _select_by_ids(
+    conn: sqlite3.Connection,
+    table: str,
+    column: str,
+    ids: Iterable[str],
+    select: str = "*",
+) -> Iterator[sqlite3.Row]:
+    """Yield rows whose *column* is in *ids*, one ``IN (...)`` query per chunk."""
+    unique = list(dict.fromkeys(ids))
+    for start in range(0, len(unique), _IN_CHUNK):
+        chunk = unique[start : start + _IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        yield from conn.execute(
+            f"SELECT {select} FROM {table} WHERE {column} IN ({placeholders})", chunk
+        )
+
+
 # ---------------------------------------------------------------------------
 # Init
 # ---------------------------------------------------------------------------
 
 
-def init_db(path: Path) -> sqlite3.Connection:
-    """Create / open the SQLite database and ensure all tables exist."""
+def _schema_version() -> int:
+    """Fingerprint of all DDL, stored in ``PRAGMA user_version`` once applied.
+
+    Derived from the statements themselves so that editing the schema or
+    adding a migration invalidates it without a hand-maintained counter.
+    """
+    ddl = "\0".join([_SCHEMA, *_MIGRATIONS, *_POST_MIGRATIONS])
+    return zlib.crc32(ddl.encode()) & 0x7FFFFFFF  # user_version is signed 32-bit
+
+
+_SCHEMA_VERSION = _schema_version()
+
+
+def init_db(path: Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Create / open the SQLite database and ensure all tables exist.
+
+    The DDL is replayed only when the database's ``user_version`` does not
+    match the current schema, so reopening an up-to-date database costs a
+    handful of PRAGMAs.  Pass ``check_same_thread=False`` for a connection
+    that is handed between threads (the caller must serialise access).
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
+    conn = sqlite3.connect(str(path), check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    # WAL lets the launchd inbox check write while the CLI/TUI read; in WAL
+    # mode synchronous=NORMAL is still crash-safe and avoids an fsync per commit.
     conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA cache_size=-32000;")  # 32 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456;")  # 256 MiB memory-mapped reads
+    conn.execute("PRAGMA temp_store=MEMORY;")
     conn.execute("PRAGMA foreign_keys=ON;")
+    if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+        return conn
+
     conn.executescript(_SCHEMA)
+    complete = True
     for stmt in _MIGRATIONS:
         try:
             conn.execute(stmt)
-        except sqlite3.OperationalError:
-            pass  # column already exists
+        except sqlite3.OperationalError as exc:
+            if "duplicate column name" not in str(exc):
+                # e.g. the DB is locked; leave user_version unset so the next open retries.
+                complete = False
     for stmt in _POST_MIGRATIONS:
         try:
             conn.execute(stmt)
         except sqlite3.OperationalError:
-            pass  # table already exists or DB is locked by another process
+            # Every statement is IF NOT EXISTS, so this means the DB is locked
+            # by another process; leave user_version unset so the next open retries.
+            complete = False
+    if complete:
+        conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
     conn.commit()
     return conn
 
 
+@lru_cache(maxsize=1)
 def get_default_db_path() -> Path:
     """Return ``data/emplaiyed.db`` relative to the project root."""
     from emplaiyed.core.paths import find_project_root
@@ -224,48 +337,76 @@ def get_default_db_path() -> Path:
 # ---------------------------------------------------------------------------
 
 
-def save_opportunity(conn: sqlite3.Connection, opportunity: Opportunity) -> None:
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO opportunities
-            (id, short_id, source, source_url, company, title, description,
-             location, salary_min, salary_max, posted_date, scraped_at, raw_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            opportunity.id,
-            opportunity.short_id,
-            opportunity.source,
-            opportunity.source_url,
-            opportunity.company,
-            opportunity.title,
-            opportunity.description,
-            opportunity.location,
-            opportunity.salary_min,
-            opportunity.salary_max,
-            _date_to_str(opportunity.posted_date),
-            _datetime_to_str(opportunity.scraped_at),
-            _json_dumps(opportunity.raw_data),
-        ),
+_SAVE_OPPORTUNITY_SQL = """
+    INSERT OR REPLACE INTO opportunities
+        (id, short_id, source, source_url, company, title, description,
+         location, salary_min, salary_max, posted_date, scraped_at, raw_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_OPPORTUNITY_FTS_SQL = """
+    INSERT INTO opportunities_fts (opp_id, company, title, description, location)
+    VALUES (?, ?, ?, COALESCE(?, ''), COALESCE(?, ''))
+"""
+
+
+def _opportunity_params(opportunity: Opportunity) -> tuple:
+    return (
+        opportunity.id,
+        opportunity.short_id,
+        opportunity.source,
+        opportunity.source_url,
+        opportunity.company,
+        opportunity.title,
+        opportunity.description,
+        opportunity.location,
+        opportunity.salary_min,
+        opportunity.salary_max,
+        _date_to_str(opportunity.posted_date),
+        _datetime_to_str(opportunity.scraped_at),
+        _json_dumps(opportunity.raw_data),
+    )
+
+
+def _opportunity_fts_params(opportunity: Opportunity) -> tuple:
+    return (
+        opportunity.id,
+        opportunity.company,
+        opportunity.title,
+        opportunity.description,
+        opportunity.location,
     )
+
+
+def save_opportunity(conn: sqlite3.Connection, opportunity: Opportunity) -> None:
+    conn.execute(_SAVE_OPPORTUNITY_SQL, _opportunity_params(opportunity))
     # Keep FTS index in sync — delete stale row (if any) then insert fresh.
     conn.execute("DELETE FROM opportunities_fts WHERE opp_id = ?", (opportunity.id,))
-    conn.execute(
-        """
-        INSERT INTO opportunities_fts (opp_id, company, title, description, location)
-        VALUES (?, ?, ?, COALESCE(?, ''), COALESCE(?, ''))
-        """,
-        (
-            opportunity.id,
-            opportunity.company,
-            opportunity.title,
-            opportunity.description,
-            opportunity.location,
-        ),
-    )
+    conn.execute(_INSERT_OPPORTUNITY_FTS_SQL, _opportunity_fts_params(opportunity))
     conn.commit()
 
 
+def save_opportunities(
+    conn: sqlite3.Connection, opportunities: Iterable[Opportunity]
+) -> None:
+    """Save several opportunities in one transaction (one commit, not one per row)."""
+    opportunities = list(opportunities)
+    if not opportunities:
+        return
+    with conn:
+        conn.executemany(
+            _SAVE_OPPORTUNITY_SQL, [_opportunity_params(o) for o in opportunities]
+        )
+        conn.executemany(
+            "DELETE FROM opportunities_fts WHERE opp_id = ?",
+            [(o.id,) for o in opportunities],
+        )
+        conn.executemany(
+            _INSERT_OPPORTUNITY_FTS_SQL,
+            [_opportunity_fts_params(o) for o in opportunities],
+        )
+
+
 def _row_to_opportunity(row: sqlite3.Row) -> Opportunity:
     # short_id may be NULL for opportunities created before the migration.
     # In that case, generate one and let it persist on next save.
@@ -295,6 +436,16 @@ def get_opportunity(conn: sqlite3.Connection, id: str) -> Opportunity | None:
     return _row_to_opportunity(row) if row else None
 
 
+def get_opportunities_many(
+    conn: sqlite3.Connection, ids: Iterable[str]
+) -> dict[str, Opportunity]:
+    """Fetch several opportunities at once, keyed by ID.  Missing IDs are omitted."""
+    return {
+        row["id"]: _row_to_opportunity(row)
+        for row in _select_by_ids(conn, "opportunities", "id", ids)
+    }
+
+
 def get_opportunity_by_short_id(
     conn: sqlite3.Connection, short_id: str
 ) -> Opportunity | None:
@@ -304,6 +455,22 @@ def get_opportunity_by_short_id(
     return _row_to_opportunity(row) if row else None
 
 
+def get_opportunity_for_application(
+    conn: sqlite3.Connection, application_id: str
+) -> Opportunity | None:
+    """Return the opportunity behind an application, in a single JOIN query."""
+    cur = conn.execute(
+        """
+        SELECT o.* FROM applications a
+        JOIN opportunities o ON o.id = a.opportunity_id
+        WHERE a.id = ?
+        """,
+        (application_id,),
+    )
+    row = cur.fetchone()
+    return _row_to_opportunity(row) if row else None
+
+
 def list_opportunities(conn: sqlite3.Connection, **filters: Any) -> list[Opportunity]:
     query = "SELECT * FROM opportunities"
     params: list[Any] = []
@@ -343,7 +510,9 @@ def active_opportunity_keys(conn: sqlite3.Connection) -> set[tuple[str, str, str
 # ---------------------------------------------------------------------------
 
 
-def save_application(conn: sqlite3.Connection, application: Application) -> None:
+def save_application(
+    conn: sqlite3.Connection, application: Application, *, commit: bool = True
+) -> None:
     conn.execute(
         """
         INSERT OR REPLACE INTO applications
@@ -363,7 +532,8 @@ def save_application(conn: sqlite3.Connection, application: Application) -> None
             _datetime_to_str(application.updated_at),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def _row_to_application(row: sqlite3.Row) -> Application:
@@ -386,6 +556,29 @@ def get_application(conn: sqlite3.Connection, id: str) -> Application | None:
     return _row_to_application(row) if row else None
 
 
+def get_applications_many(
+    conn: sqlite3.Connection, ids: Iterable[str]
+) -> dict[str, Application]:
+    """Fetch several applications at once, keyed by ID.  Missing IDs are omitted."""
+    return {
+        row["id"]: _row_to_application(row)
+        for row in _select_by_ids(conn, "applications", "id", ids)
+    }
+
+
+def get_applications_by_id_prefix(
+    conn: sqlite3.Connection, prefix: str, limit: int = 2
+) -> list[Application]:
+    """Return up to *limit* applications whose ID starts with *prefix*.
+
+    Uses an indexed range query on the primary key, so only the matching
+    rows are read.  The default ``limit=2`` is enough to tell a unique
+    match from an ambiguous one.
+    """
+    rows = _select_by_id_prefix(conn, "applications", prefix, limit)
+    return [_row_to_application(row) for row in rows]
+
+
 def list_applications(conn: sqlite3.Connection, **filters: Any) -> list[Application]:
     query = "SELECT * FROM applications"
     params: list[Any] = []
@@ -407,6 +600,59 @@ def list_applications(conn: sqlite3.Connection, **filters: Any) -> list[Applicat
     return [_row_to_application(row) for row in cur.fetchall()]
 
 
+def count_applications_by_status(conn: sqlite3.Connection) -> dict[str, int]:
+    """Return ``{status: count}`` for every status that has applications."""
+    cur = conn.execute("SELECT status, COUNT(*) FROM applications GROUP BY status")
+    return {row[0]: row[1] for row in cur.fetchall()}
+
+
+class ApplicationSummary(NamedTuple):
+    """Lightweight application + opportunity row for listings.
+
+    Values are passed through from SQLite unparsed (``updated_at`` is the
+    stored ISO string) so listing rows skip model validation entirely.
+    """
+
+    id: str
+    status: str
+    updated_at: str
+    company: str | None
+    title: str | None
+
+
+def iter_applications_with_opportunity(
+    conn: sqlite3.Connection,
+    status: ApplicationStatus | None = None,
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+) -> Iterator[ApplicationSummary]:
+    """Yield applications joined with their opportunity, newest first.
+
+    One query instead of a ``get_opportunity`` per application; rows are
+    read from the cursor as they are consumed.  ``company`` and ``title``
+    are ``None`` when the opportunity row is missing.  Pass *limit* /
+    *offset* to page through long lists.
+    """
+    query = """
+        SELECT a.id, a.status, a.updated_at, o.company, o.title
+        FROM applications a
+        LEFT JOIN opportunities o ON o.id = a.opportunity_id
+    """
+    params: list[Any] = []
+    if status is not None:
+        query += " WHERE a.status = ?"
+        params.append(status.value)
+    query += " ORDER BY a.updated_at DESC"
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    cur = conn.execute(query, params)
+    cur.row_factory = None  # plain tuples; cheaper than sqlite3.Row
+    for row in cur:
+        yield ApplicationSummary._make(row)
+
+
 def delete_application(conn: sqlite3.Connection, application_id: str) -> None:
     """Delete an application and all related data (cascading).
 
@@ -450,7 +696,9 @@ def delete_application(conn: sqlite3.Connection, application_id: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def save_interaction(conn: sqlite3.Connection, interaction: Interaction) -> None:
+def save_interaction(
+    conn: sqlite3.Connection, interaction: Interaction, *, commit: bool = True
+) -> None:
     conn.execute(
         """
         INSERT OR REPLACE INTO interactions
@@ -468,7 +716,8 @@ def save_interaction(conn: sqlite3.Connection, interaction: Interaction) -> None
             _datetime_to_str(interaction.created_at),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def _row_to_interaction(row: sqlite3.Row) -> Interaction:
@@ -544,7 +793,8 @@ def get_offer(conn: sqlite3.Connection, id: str) -> Offer | None:
     return _row_to_offer(row) if row else None
 
 
-def list_offers(conn: sqlite3.Connection, **filters: Any) -> list[Offer]:
+def iter_offers(conn: sqlite3.Connection, **filters: Any) -> Iterator[Offer]:
+    """Yield offers newest first, reading rows from the cursor as consumed."""
     query = "SELECT * FROM offers"
     params: list[Any] = []
     clauses: list[str] = []
@@ -561,8 +811,42 @@ def list_offers(conn: sqlite3.Connection, **filters: Any) -> list[Offer]:
         query += " WHERE " + " AND ".join(clauses)
 
     query += " ORDER BY created_at DESC"
-    cur = conn.execute(query, params)
-    return [_row_to_offer(row) for row in cur.fetchall()]
+    for row in conn.execute(query, params):
+        yield _row_to_offer(row)
+
+
+def list_offers(conn: sqlite3.Connection, **filters: Any) -> list[Offer]:
+    return list(iter_offers(conn, **filters))
+
+
+class OfferSummary(NamedTuple):
+    """Offer + opportunity row for the offers listing, passed through unparsed."""
+
+    salary: int | None
+    deadline: str | None
+    status: str
+    company: str | None
+    title: str | None
+
+
+def iter_offers_with_opportunity(conn: sqlite3.Connection) -> Iterator[OfferSummary]:
+    """Yield every offer joined with its application's opportunity, newest first.
+
+    ``company`` and ``title`` are ``None`` when the application or
+    opportunity row is missing.
+    """
+    cur = conn.execute(
+        """
+        SELECT f.salary, f.deadline, f.status, o.company, o.title
+        FROM offers f
+        LEFT JOIN applications a ON a.id = f.application_id
+        LEFT JOIN opportunities o ON o.id = a.opportunity_id
+        ORDER BY f.created_at DESC
+        """
+    )
+    cur.row_factory = None  # plain tuples; cheaper than sqlite3.Row
+    for row in cur:
+        yield OfferSummary._make(row)
 
 
 # ---------------------------------------------------------------------------
@@ -570,7 +854,9 @@ def list_offers(conn: sqlite3.Connection, **filters: Any) -> list[Offer]:
 # ---------------------------------------------------------------------------
 
 
-def save_event(conn: sqlite3.Connection, event: ScheduledEvent) -> None:
+def save_event(
+    conn: sqlite3.Connection, event: ScheduledEvent, *, commit: bool = True
+) -> None:
     conn.execute(
         """
         INSERT OR REPLACE INTO scheduled_events
@@ -586,7 +872,8 @@ def save_event(conn: sqlite3.Connection, event: ScheduledEvent) -> None:
             _datetime_to_str(event.created_at),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def _row_to_event(row: sqlite3.Row) -> ScheduledEvent:
@@ -630,13 +917,20 @@ def list_events(conn: sqlite3.Connection, **filters: Any) -> list[ScheduledEvent
     return [_row_to_event(row) for row in cur.fetchall()]
 
 
-def list_upcoming_events(conn: sqlite3.Connection) -> list[ScheduledEvent]:
-    """Return events from now onwards, sorted by scheduled date."""
+def list_upcoming_events(
+    conn: sqlite3.Connection, *, limit: int | None = None
+) -> list[ScheduledEvent]:
+    """Return events from now onwards, sorted by scheduled date.
+
+    Pass *limit* to read only the next *limit* events.
+    """
     now = _datetime_to_str(datetime.now())
-    cur = conn.execute(
-        "SELECT * FROM scheduled_events WHERE scheduled_date >= ? ORDER BY scheduled_date ASC",
-        (now,),
-    )
+    query = "SELECT * FROM scheduled_events WHERE scheduled_date >= ? ORDER BY scheduled_date ASC"
+    params: list[Any] = [now]
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    cur = conn.execute(query, params)
     return [_row_to_event(row) for row in cur.fetchall()]
 
 
@@ -650,7 +944,9 @@ def delete_event(conn: sqlite3.Connection, id: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def save_work_item(conn: sqlite3.Connection, item: WorkItem) -> None:
+def save_work_item(
+    conn: sqlite3.Connection, item: WorkItem, *, commit: bool = True
+) -> None:
     conn.execute(
         """
         INSERT OR REPLACE INTO work_items
@@ -672,7 +968,8 @@ def save_work_item(conn: sqlite3.Connection, item: WorkItem) -> None:
             _datetime_to_str(item.completed_at),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def _row_to_work_item(row: sqlite3.Row) -> WorkItem:
@@ -697,6 +994,14 @@ def get_work_item(conn: sqlite3.Connection, id: str) -> WorkItem | None:
     return _row_to_work_item(row) if row else None
 
 
+def get_work_items_by_id_prefix(
+    conn: sqlite3.Connection, prefix: str, limit: int = 2
+) -> list[WorkItem]:
+    """Return up to *limit* work items whose ID starts with *prefix*."""
+    rows = _select_by_id_prefix(conn, "work_items", prefix, limit)
+    return [_row_to_work_item(row) for row in rows]
+
+
 def list_work_items(conn: sqlite3.Connection, **filters: Any) -> list[WorkItem]:
     query = "SELECT * FROM work_items"
     params: list[Any] = []
@@ -721,17 +1026,83 @@ def list_work_items(conn: sqlite3.Connection, **filters: Any) -> list[WorkItem]:
     return [_row_to_work_item(row) for row in cur.fetchall()]
 
 
+def application_ids_with_work(
+    conn: sqlite3.Connection, application_ids: Iterable[str]
+) -> set[str]:
+    """Return the subset of *application_ids* that have at least one work item."""
+    return {
+        row[0]
+        for row in _select_by_ids(
+            conn, "work_items", "application_id", application_ids,
+            select="DISTINCT application_id",
+        )
+    }
+
+
 def list_pending_work_items(conn: sqlite3.Connection) -> list[WorkItem]:
     """Return all PENDING work items, oldest first."""
     return list_work_items(conn, status=WorkStatus.PENDING)
 
 
+def get_pending_work_item_for_application(
+    conn: sqlite3.Connection, application_id: str
+) -> WorkItem | None:
+    """Return the oldest PENDING work item for *application_id*, if any."""
+    cur = conn.execute(
+        """
+        SELECT * FROM work_items
+        WHERE application_id = ? AND status = ?
+        ORDER BY created_at ASC LIMIT 1
+        """,
+        (application_id, WorkStatus.PENDING.value),
+    )
+    row = cur.fetchone()
+    return _row_to_work_item(row) if row else None
+
+
+class WorkItemSummary(NamedTuple):
+    """Lightweight work-item row for the queue listing (values unparsed)."""
+
+    id: str
+    work_type: str
+    title: str
+    created_at: str
+
+
+def iter_pending_work_summaries(conn: sqlite3.Connection) -> Iterator[WorkItemSummary]:
+    """Yield PENDING work items as summaries, oldest first.
+
+    Skips the instructions/draft columns and model validation that a full
+    ``WorkItem`` needs; use ``list_pending_work_items`` when those matter.
+    """
+    cur = conn.execute(
+        """
+        SELECT id, work_type, title, created_at FROM work_items
+        WHERE status = ? ORDER BY created_at ASC
+        """,
+        (WorkStatus.PENDING.value,),
+    )
+    cur.row_factory = None  # plain tuples; cheaper than sqlite3.Row
+    for row in cur:
+        yield WorkItemSummary._make(row)
+
+
+def count_pending_work_items(conn: sqlite3.Connection) -> int:
+    """Return the number of PENDING work items without loading them."""
+    cur = conn.execute(
+        "SELECT COUNT(*) FROM work_items WHERE status = ?", (WorkStatus.PENDING.value,)
+    )
+    return cur.fetchone()[0]
+
+
 # ---------------------------------------------------------------------------
 # Status History CRUD
 # ---------------------------------------------------------------------------
 
 
-def save_status_transition(conn: sqlite3.Connection, t: StatusTransition) -> None:
+def save_status_transition(
+    conn: sqlite3.Connection, t: StatusTransition, *, commit: bool = True
+) -> None:
     conn.execute(
         """
         INSERT INTO status_history
@@ -746,7 +1117,8 @@ def save_status_transition(conn: sqlite3.Connection, t: StatusTransition) -> Non
             _datetime_to_str(t.transitioned_at),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def _row_to_status_transition(row: sqlite3.Row) -> StatusTransition:
@@ -770,6 +1142,18 @@ def list_status_transitions(
     return [_row_to_status_transition(row) for row in cur.fetchall()]
 
 
+def list_all_status_transitions(conn: sqlite3.Connection) -> list[StatusTransition]:
+    """Return every status transition, grouped by application, oldest first.
+
+    One query for whole-pipeline views (the funnel) instead of one
+    ``list_status_transitions`` call per application.
+    """
+    cur = conn.execute(
+        "SELECT * FROM status_history ORDER BY application_id, transitioned_at ASC"
+    )
+    return [_row_to_status_transition(row) for row in cur.fetchall()]
+
+
 # ---------------------------------------------------------------------------
 # Multi-status application query
 # ---------------------------------------------------------------------------
@@ -948,13 +1332,21 @@ def save_processed_email(
     conn.commit()
 
 
-def list_processed_emails(conn: sqlite3.Connection, *, limit: int = 50) -> list[dict]:
-    """Return recent processed emails as dicts, newest first."""
+def iter_processed_emails(
+    conn: sqlite3.Connection, *, limit: int = 50
+) -> Iterator[dict]:
+    """Yield recent processed emails as dicts, newest first, straight off the cursor."""
     cur = conn.execute(
         "SELECT * FROM processed_emails ORDER BY processed_at DESC LIMIT ?",
         (limit,),
     )
-    return [dict(row) for row in cur.fetchall()]
+    for row in cur:
+        yield dict(row)
+
+
+def list_processed_emails(conn: sqlite3.Connection, *, limit: int = 50) -> list[dict]:
+    """Return recent processed emails as dicts, newest first."""
+    return list(iter_processed_emails(conn, limit=limit))
 
 
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -50,6 +51,7 @@ def save_profile(profile: Profile, path: Path) -> None:
         )
 
 
+@lru_cache(maxsize=1)
 def get_default_profile_path() -> Path:
     """Return ``data/profile.yaml`` relative to the project root."""
     from emplaiyed.core.paths import find_project_root
@@ -1,9 +1,26 @@
-from emplaiyed.followup.agent import (
-    FollowUpDraft,
-    draft_followup,
-    enqueue_followup,
-    find_stale_applications,
-    send_followup,
-)
-
-__all__ = ["FollowUpDraft", "draft_followup", "enqueue_followup", "find_stale_applications", "send_followup"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from emplaiyed.followup.agent import (
+        FollowUpDraft,
+        draft_followup,
+        enqueue_followup,
+        find_stale_applications,
+        send_followup,
+    )
+
+__all__ = [
+    "FollowUpDraft",
+    "draft_followup",
+    "enqueue_followup",
+    "find_stale_applications",
+    "send_followup",
+]
+
+_LAZY = dict.fromkeys(__all__, "emplaiyed.followup.agent")
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
@@ -1,7 +1,14 @@
 """CV and motivation letter generation for job applications."""
 
-from emplaiyed.generation.cv_generator import GeneratedCV, generate_cv
-from emplaiyed.generation.letter_generator import GeneratedLetter, generate_letter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from emplaiyed.generation.cv_generator import GeneratedCV, generate_cv
+    from emplaiyed.generation.letter_generator import GeneratedLetter, generate_letter
 
 __all__ = [
     "GeneratedCV",
@@ -9,3 +16,12 @@ __all__ = [
     "generate_cv",
     "generate_letter",
 ]
+
+_LAZY = {
+    "GeneratedCV": "emplaiyed.generation.cv_generator",
+    "generate_cv": "emplaiyed.generation.cv_generator",
+    "GeneratedLetter": "emplaiyed.generation.letter_generator",
+    "generate_letter": "emplaiyed.generation.letter_generator",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
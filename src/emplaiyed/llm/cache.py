@@ -0,0 +1,69 @@
+"""On-disk cache for structured LLM responses.
+
+Entries are keyed on a hash of the inputs that shape the prompt, so
+re-running a command on unchanged data reuses the previous answer instead
+of paying for another call.  Editing the profile, opportunity or offer
+changes the key and triggers a fresh generation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Bump when prompts change in a way that should invalidate every entry.
+_CACHE_VERSION = 1
+
+
+def get_default_cache_dir() -> Path:
+    """Return ``data/llm_cache`` relative to the project root."""
+    from emplaiyed.core.paths import find_project_root
+
+    return find_project_root() / "data" / "llm_cache"
+
+
+def cache_key(op: str, *inputs: BaseModel) -> str:
+    """Return a stable hex key for operation *op* applied to *inputs*."""
+    h = hashlib.blake2b(f"{op}:{_CACHE_VERSION}".encode(), digest_size=16)
+    for item in inputs:
+        h.update(b"\0")
+        h.update(item.model_dump_json().encode())
+    return h.hexdigest()
+
+
+async def cached_call(
+    key: str,
+    output_type: type[T],
+    fn: Callable[[], Awaitable[T]],
+    *,
+    refresh: bool = False,
+    cache_dir: Path | None = None,
+) -> T:
+    """Return the cached result for *key*, or await *fn* and store its result.
+
+    With ``refresh=True`` the cached entry is ignored (and overwritten).
+    Unreadable or outdated entries are treated as misses.
+    """
+    path = (cache_dir or get_default_cache_dir()) / f"{key}.json"
+    if not refresh:
+        try:
+            return output_type.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except ValidationError:
+            logger.debug("Discarding unreadable LLM cache entry %s", path)
+
+    result = await fn()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(result.model_dump_json(), encoding="utf-8")
+    tmp.replace(path)
+    return result
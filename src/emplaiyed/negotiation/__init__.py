@@ -1,3 +1,14 @@
-from emplaiyed.negotiation.advisor import NegotiationStrategy, generate_negotiation
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from emplaiyed.negotiation.advisor import NegotiationStrategy, generate_negotiation
 
 __all__ = ["NegotiationStrategy", "generate_negotiation"]
+
+_LAZY = dict.fromkeys(__all__, "emplaiyed.negotiation.advisor")
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
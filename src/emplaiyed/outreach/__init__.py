@@ -1,3 +1,19 @@
-from emplaiyed.outreach.drafter import OutreachDraft, draft_outreach, enqueue_outreach, send_outreach
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from emplaiyed.outreach.drafter import (
+        OutreachDraft,
+        draft_outreach,
+        enqueue_outreach,
+        send_outreach,
+    )
 
 __all__ = ["OutreachDraft", "draft_outreach", "enqueue_outreach", "send_outreach"]
+
+_LAZY = dict.fromkeys(__all__, "emplaiyed.outreach.drafter")
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
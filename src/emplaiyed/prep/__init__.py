@@ -1,3 +1,14 @@
-from emplaiyed.prep.agent import PrepSheet, generate_prep
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from emplaiyed.prep.agent import PrepSheet, generate_prep
 
 __all__ = ["PrepSheet", "generate_prep"]
+
+_LAZY = dict.fromkeys(__all__, "emplaiyed.prep.agent")
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from emplaiyed._lazy import lazy_getattr
 from emplaiyed.sources.base import BaseSource, SearchQuery
-from emplaiyed.sources.guichet_emplois import GuichetEmploisSource
-from emplaiyed.sources.indeed import IndeedSource
-from emplaiyed.sources.jobbank import JobBankSource
-from emplaiyed.sources.jobillico import JobillicoSource
-from emplaiyed.sources.manual import ManualSource
-from emplaiyed.sources.talent import TalentSource
+
+if TYPE_CHECKING:
+    from emplaiyed.sources.guichet_emplois import GuichetEmploisSource
+    from emplaiyed.sources.indeed import IndeedSource
+    from emplaiyed.sources.jobbank import JobBankSource
+    from emplaiyed.sources.jobillico import JobillicoSource
+    from emplaiyed.sources.manual import ManualSource
+    from emplaiyed.sources.talent import TalentSource
 
 __all__ = [
     "BaseSource",
@@ -20,15 +26,27 @@ __all__ = [
     "get_available_sources",
 ]
 
+# Scraper classes are resolved from their submodule on first access, so that
+# importing the package does not pull in httpx, BeautifulSoup and friends.
+_LAZY = {
+    "ManualSource": "emplaiyed.sources.manual",
+    "JobBankSource": "emplaiyed.sources.jobbank",
+    "JobillicoSource": "emplaiyed.sources.jobillico",
+    "TalentSource": "emplaiyed.sources.talent",
+    "GuichetEmploisSource": "emplaiyed.sources.guichet_emplois",
+    "IndeedSource": "emplaiyed.sources.indeed",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
+
+
+@lru_cache(maxsize=1)
+def _source_registry() -> dict[str, BaseSource]:
+    # Sources are stateless, so one instance of each serves the whole process.
+    sources: list[BaseSource] = [__getattr__(name)() for name in _LAZY]
+    return {s.name: s for s in sources}
+
 
 def get_available_sources() -> dict[str, BaseSource]:
     """Return all registered sources, keyed by their name."""
-    sources: list[BaseSource] = [
-        ManualSource(),
-        JobBankSource(),
-        JobillicoSource(),
-        TalentSource(),
-        GuichetEmploisSource(),
-        IndeedSource(),
-    ]
-    return {s.name: s for s in sources}
+    return dict(_source_registry())
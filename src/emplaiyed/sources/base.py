@@ -4,10 +4,11 @@ import logging
 import sqlite3
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from emplaiyed.core.database import (
     active_opportunity_keys,
-    save_opportunity,
+    save_opportunities,
 )
 from emplaiyed.core.models import Opportunity
 
@@ -27,6 +28,10 @@ class SearchQuery:
 class BaseSource(ABC):
     """Base class for all job sources."""
 
+    #: False for placeholder sources whose ``scrape`` raises NotImplementedError.
+    #: Read by ``sources list`` so reporting status needs no network call.
+    implemented: ClassVar[bool] = True
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,12 +59,13 @@ class BaseSource(ABC):
         for opp in opportunities:
             key = (opp.company.lower(), opp.title.lower(), opp.source.lower())
             if key not in existing_keys:
-                save_opportunity(db_conn, opp)
                 existing_keys.add(key)
                 saved.append(opp)
             else:
                 skipped += 1
                 logger.debug("Skipping duplicate: %s at %s", opp.title, opp.company)
 
+        save_opportunities(db_conn, saved)
+
         logger.debug("Saved %d new, skipped %d duplicates", len(saved), skipped)
         return saved
@@ -17,12 +17,14 @@ import asyncio
 import logging
 import math
 from datetime import datetime
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from emplaiyed.core.models import Opportunity
 from emplaiyed.sources.base import BaseSource, SearchQuery
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Hours per year for hourly -> annual conversion (40h/week * 52 weeks)
@@ -116,6 +118,10 @@ def _dataframe_to_opportunities(
     df: pd.DataFrame, max_results: int
 ) -> list[Opportunity]:
     """Convert a jobspy DataFrame into a list of Opportunity models."""
+    # Deferred: pandas is only needed once a scrape has returned, and costs
+    # ~200ms to import on every CLI start via ``emplaiyed.sources``.
+    import pandas as pd
+
     opportunities: list[Opportunity] = []
 
     for _, row in df.head(max_results).iterrows():
@@ -150,9 +150,12 @@ def transition(
     conn: sqlite3.Connection,
     application_id: str,
     target: ApplicationStatus,
+    *,
+    commit: bool = True,
 ) -> Application:
     """Validate and perform a status transition, updating the database.
 
+    Pass ``commit=False`` to leave the writes in the caller's transaction.
     Returns the updated Application.
     Raises ``InvalidTransitionError`` if the transition is not valid.
     Raises ``ValueError`` if the application is not found.
@@ -171,7 +174,7 @@ def transition(
             "updated_at": now,
         }
     )
-    save_application(conn, updated)
+    save_application(conn, updated, commit=False)
 
     save_status_transition(
         conn,
@@ -181,5 +184,6 @@ def transition(
             to_status=target.value,
             transitioned_at=now,
         ),
+        commit=commit,
     )
     return updated
@@ -54,9 +54,6 @@ def create_work_item(
         previous_status: Status to revert to when "skip".
         pending_status: The PENDING status to transition to now.
     """
-    # Transition to the PENDING state
-    transition(conn, application_id, pending_status)
-
     item = WorkItem(
         application_id=application_id,
         work_type=work_type,
@@ -67,7 +64,10 @@ def create_work_item(
         previous_status=previous_status.value,
         created_at=datetime.now(),
     )
-    save_work_item(conn, item)
+    # Transition to the PENDING state and record the item in one commit.
+    with conn:
+        transition(conn, application_id, pending_status, commit=False)
+        save_work_item(conn, item, commit=False)
     logger.debug("Work item created: %s (%s)", item.id, title)
     return item
 
@@ -88,7 +88,7 @@ def complete_work_item(
 
     target = ApplicationStatus(item.target_status)
 
-    # Record the interaction
+    # The interaction to record
     interaction = Interaction(
         application_id=item.application_id,
         type=_interaction_type_for(item.work_type),
@@ -97,19 +97,18 @@ def complete_work_item(
         content=item.draft_content,
         created_at=datetime.now(),
     )
-    save_interaction(conn, interaction)
-
-    # Transition the application
-    transition(conn, item.application_id, target)
-
-    # Mark work item complete
     updated = item.model_copy(
         update={
             "status": WorkStatus.COMPLETED,
             "completed_at": datetime.now(),
         }
     )
-    save_work_item(conn, updated)
+    # Record the interaction, advance the application and close the item
+    # in one commit.
+    with conn:
+        save_interaction(conn, interaction, commit=False)
+        transition(conn, item.application_id, target, commit=False)
+        save_work_item(conn, updated, commit=False)
     logger.debug("Work item completed: %s → %s", work_item_id, target.value)
     return updated
 
@@ -130,17 +129,16 @@ def skip_work_item(
 
     previous = ApplicationStatus(item.previous_status)
 
-    # Revert the application state
-    transition(conn, item.application_id, previous)
-
-    # Mark work item skipped
     updated = item.model_copy(
         update={
             "status": WorkStatus.SKIPPED,
             "completed_at": datetime.now(),
         }
     )
-    save_work_item(conn, updated)
+    # Revert the application state and mark the item skipped in one commit.
+    with conn:
+        transition(conn, item.application_id, previous, commit=False)
+        save_work_item(conn, updated, commit=False)
     logger.debug("Work item skipped: %s → %s", work_item_id, previous.value)
     return updated
 
@@ -0,0 +1,106 @@
+"""Tests for the shared CLI helpers in ``emplaiyed.cli``."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from emplaiyed.cli import (
+    close_db_connection,
+    db_connection,
+    require_profile,
+    resolve_application,
+    try_load_profile,
+)
+from emplaiyed.core.database import save_application, save_opportunity
+from emplaiyed.core.models import Profile
+from emplaiyed.core.profile_store import load_profile, save_profile
+
+
+def _write_profile(path: Path, name: str) -> None:
+    save_profile(Profile(name=name, email="a@example.com"), path)
+
+
+class TestDbConnection:
+    def test_connection_is_reused(self, tmp_path: Path):
+        path = tmp_path / "test.db"
+        with patch("emplaiyed.cli.get_default_db_path", return_value=path):
+            with db_connection() as first:
+                pass
+            with db_connection() as second:
+                pass
+        assert first is second
+        # Leaving the block does not close it.
+        first.execute("SELECT 1")
+        close_db_connection()
+
+    def test_reopens_when_path_changes(self, tmp_path: Path):
+        with patch("emplaiyed.cli.get_default_db_path", return_value=tmp_path / "a.db"):
+            with db_connection() as first:
+                pass
+        with patch("emplaiyed.cli.get_default_db_path", return_value=tmp_path / "b.db"):
+            with db_connection() as second:
+                pass
+        assert first is not second
+        assert (tmp_path / "b.db").exists()
+        close_db_connection()
+
+    def test_rolls_back_on_error(self, tmp_path: Path):
+        path = tmp_path / "test.db"
+        with patch("emplaiyed.cli.get_default_db_path", return_value=path):
+            try:
+                with db_connection() as conn:
+                    conn.execute("CREATE TABLE t (x INTEGER)")
+                    conn.execute("INSERT INTO t VALUES (1)")
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+            with db_connection() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        close_db_connection()
+
+
+class TestResolveApplication:
+    def _save(self, db, sample_opportunity, sample_application, ids):
+        save_opportunity(db, sample_opportunity)
+        for app_id in ids:
+            save_application(db, sample_application.model_copy(update={"id": app_id}))
+
+    def test_exact_id_wins_over_longer_ids(self, db, sample_opportunity, sample_application):
+        self._save(db, sample_opportunity, sample_application, ["app-1", "app-10"])
+        assert resolve_application(db, "app-1").id == "app-1"
+
+    def test_unique_prefix(self, db, sample_opportunity, sample_application):
+        self._save(db, sample_opportunity, sample_application, ["app-1", "bpp-2"])
+        assert resolve_application(db, "bp").id == "bpp-2"
+
+    def test_ambiguous_prefix_exits(self, db, sample_opportunity, sample_application):
+        self._save(db, sample_opportunity, sample_application, ["app-1", "app-2"])
+        with pytest.raises(typer.Exit):
+            resolve_application(db, "app-")
+
+
+class TestProfileCache:
+    def test_second_load_reuses_parse(self, tmp_path: Path):
+        path = tmp_path / "profile.yaml"
+        _write_profile(path, "Alice")
+        with patch("emplaiyed.cli.get_default_profile_path", return_value=path), \
+             patch("emplaiyed.cli.load_profile", wraps=load_profile) as spy:
+            first = require_profile()
+            second = try_load_profile()
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_reloads_when_file_changes(self, tmp_path: Path):
+        path = tmp_path / "profile.yaml"
+        _write_profile(path, "Alice")
+        with patch("emplaiyed.cli.get_default_profile_path", return_value=path):
+            assert require_profile().name == "Alice"
+            _write_profile(path, "Bob")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert require_profile().name == "Bob"
@@ -0,0 +1,66 @@
+"""Tests for the followup CLI command helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from emplaiyed.cli.followup_cmd import _draft_all
+from emplaiyed.followup import FollowUpDraft
+from emplaiyed.main import app
+
+runner = CliRunner()
+
+
+class TestDraftAll:
+    async def test_drafts_concurrently_and_isolates_failures(self, sample_opportunity):
+        in_flight = 0
+        peak = 0
+
+        async def fake_draft(profile, opp, followup_num, days):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if days == 13:
+                raise RuntimeError("LLM down")
+            return FollowUpDraft(subject=f"FU{followup_num}", body=str(days))
+
+        stale = [
+            ("app-1", "FOLLOW_UP_1", sample_opportunity, 7),
+            ("app-2", "FOLLOW_UP_2", sample_opportunity, 13),
+            ("app-3", "FOLLOW_UP_1", sample_opportunity, 9),
+        ]
+        with patch("emplaiyed.followup.draft_followup", side_effect=fake_draft):
+            drafts = await _draft_all(None, stale)
+
+        assert peak == 3
+        assert drafts[0].subject == "FU1"
+        assert isinstance(drafts[1], RuntimeError)
+        assert drafts[2].body == "9"
+
+
+class TestFollowupCommand:
+    def test_cancelled_draft_is_reported_not_enqueued(
+        self, tmp_path: Path, sample_opportunity
+    ):
+        stale = [("app-1", "FOLLOW_UP_1", sample_opportunity, 7)]
+        with (
+            patch("emplaiyed.cli.get_default_db_path", return_value=tmp_path / "test.db"),
+            patch("emplaiyed.cli.followup_cmd.require_profile"),
+            patch("emplaiyed.followup.find_stale_applications", return_value=stale),
+            patch("emplaiyed.followup.enqueue_followup") as enqueue,
+            patch(
+                "emplaiyed.cli.followup_cmd._draft_all",
+                return_value=[asyncio.CancelledError()],
+            ),
+        ):
+            result = runner.invoke(app, ["followup"])
+
+        assert result.exit_code == 0, result.output
+        assert "Failed to draft" in result.output
+        enqueue.assert_not_called()
@@ -113,6 +113,7 @@ class TestFunnelList:
         assert "DISCOVERED" in result.output
         # Should show first 8 chars of the ID
         assert "app-0000" in result.output
+        assert "2025-01-15 11:00" in result.output
 
     def test_filter_by_stage(self, tmp_path: Path, sample_opportunity, sample_application):
         db_path = tmp_path / "test.db"
@@ -149,6 +150,28 @@ class TestFunnelList:
         assert result.exit_code == 0
         assert "No applications with stage" in result.output
 
+    def test_paging(self, tmp_path: Path, sample_opportunity, sample_application):
+        db_path = tmp_path / "test.db"
+        conn = init_db(db_path)
+        save_opportunity(conn, sample_opportunity)
+        for i in range(3):
+            save_application(
+                conn,
+                sample_application.model_copy(
+                    update={"id": f"app-pg{i}", "updated_at": datetime(2025, 1, 1 + i)}
+                ),
+            )
+        conn.close()
+
+        with _patch_db(db_path):
+            first = runner.invoke(app, ["funnel", "list", "--limit", "2"])
+            second = runner.invoke(app, ["funnel", "list", "--limit", "2", "--page", "2"])
+            empty = runner.invoke(app, ["funnel", "list", "--limit", "2", "--page", "3"])
+        assert "app-pg2" in first.output and "app-pg1" in first.output
+        assert "--page 2" in first.output
+        assert "app-pg0" in second.output and "app-pg2" not in second.output
+        assert "No applications on page 3" in empty.output
+
     def test_invalid_stage(self, tmp_path: Path):
         db_path = tmp_path / "empty.db"
         init_db(db_path)
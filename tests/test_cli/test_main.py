@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+
+import pytest
 from typer.testing import CliRunner
 
 from emplaiyed.main import app
@@ -20,3 +25,57 @@ def test_debug_flag():
     """--debug flag should be accepted and not error."""
     result = runner.invoke(app, ["--debug", "sources", "list"])
     assert result.exit_code == 0
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """--help and unrelated commands should not pay for pydantic-ai, pandas or scrapers."""
+    code = (
+        "import sys, emplaiyed.main; "
+        "print([m for m in ('pydantic_ai', 'pandas', 'bs4', 'httpx') if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_version_fast_path_skips_commands():
+    """``emplaiyed --version`` answers before the Typer app is imported."""
+    code = (
+        "import sys; sys.argv = ['emplaiyed', '--version']; "
+        "from emplaiyed.__main__ import main; main(); "
+        "print('emplaiyed.main' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split("\n")[:2] == ["emplaiyed 0.1.0", "False"]
+
+
+def test_entry_point_skips_logfire_pydantic_plugin():
+    """The console entry point keeps pydantic from importing logfire."""
+    code = (
+        "import sys; sys.argv = ['emplaiyed', '--help']\n"
+        "from emplaiyed.__main__ import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass\n"
+        "print('logfire' in sys.modules, file=sys.stderr)"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYDANTIC_DISABLE_PLUGINS"}
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert out.stderr.strip().endswith("False")
+
+
+def test_entry_point_uses_uvloop_when_installed():
+    pytest.importorskip("uvloop")
+    code = (
+        "import asyncio, sys; sys.argv = ['emplaiyed', '--help']\n"
+        "from emplaiyed.__main__ import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass\n"
+        "print(type(asyncio.get_event_loop_policy()).__module__, file=sys.stderr)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stderr.strip().startswith("uvloop")
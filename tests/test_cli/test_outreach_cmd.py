@@ -0,0 +1,72 @@
+"""Tests for the outreach CLI command helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from emplaiyed.cli.outreach_cmd import _prepare_all
+from emplaiyed.core.database import (
+    get_application,
+    init_db,
+    list_pending_work_items,
+    save_application,
+    save_opportunity,
+)
+from emplaiyed.core.models import Application, ApplicationStatus
+from emplaiyed.generation.pipeline import AssetPaths
+
+
+class TestPrepareAll:
+    async def test_concurrent_enqueues_share_one_connection(
+        self, tmp_path: Path, sample_opportunity
+    ):
+        """Interleaved generate-and-enqueue calls commit independently on one connection."""
+        db_path = tmp_path / "test.db"
+        conn = init_db(db_path)
+        targets = []
+        for i in range(5):
+            opp = sample_opportunity.model_copy(
+                update={"id": f"opp-{i}", "company": f"Co{i}"}
+            )
+            save_opportunity(conn, opp)
+            app_record = Application(
+                id=f"app-{i}",
+                opportunity_id=opp.id,
+                status=ApplicationStatus.SCORED,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+            save_application(conn, app_record)
+            targets.append((app_record, opp))
+
+        async def fake_generate(profile, opp, app_id, **kwargs):
+            i = int(app_id.rsplit("-", 1)[1])
+            # Later targets finish first, so enqueues land out of order.
+            await asyncio.sleep(0.01 * (5 - i))
+            if i == 2:
+                raise RuntimeError("LLM down")
+            p = tmp_path / app_id
+            return AssetPaths(p, p, p, p, p, p)
+
+        with patch("emplaiyed.generation.pipeline.generate_assets", side_effect=fake_generate):
+            results = await _prepare_all(conn, None, targets, auto_send=False)
+
+        assert isinstance(results[2], RuntimeError)
+        assert not conn.in_transaction
+
+        # Read back through a fresh connection: only committed rows are visible.
+        other = init_db(db_path)
+        try:
+            items = list_pending_work_items(other)
+            assert sorted(w.application_id for w in items) == [
+                "app-0", "app-1", "app-3", "app-4",
+            ]
+            for i in (0, 1, 3, 4):
+                assert get_application(other, f"app-{i}").status == ApplicationStatus.OUTREACH_PENDING
+            assert get_application(other, "app-2").status == ApplicationStatus.SCORED
+        finally:
+            other.close()
+            conn.close()
@@ -9,6 +9,7 @@ from unittest.mock import patch
 import pytest
 from typer.testing import CliRunner
 
+from emplaiyed.cli.schedule_cmd import _parse_date
 from emplaiyed.core.database import (
     get_application,
     init_db,
@@ -278,6 +279,26 @@ class TestScheduleCommand:
         assert "Ambiguous ID" in result.output
 
 
+class TestParseDate:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("2025-01-14 14:00", datetime(2025, 1, 14, 14, 0)),
+            ("2025-01-14 2pm", datetime(2025, 1, 14, 14, 0)),
+            ("2025-01-14 2:30 PM", datetime(2025, 1, 14, 14, 30)),
+            ("2025-01-14 12am", datetime(2025, 1, 14, 0, 0)),
+            ("2025-01-14T9", datetime(2025, 1, 14, 9, 0)),
+        ],
+    )
+    def test_accepts(self, text, expected):
+        assert _parse_date(text) == expected
+
+    @pytest.mark.parametrize("text", ["not-a-date", "2025-01-14 13pm", "2025-01-14 25:00"])
+    def test_rejects(self, text):
+        with pytest.raises(ValueError):
+            _parse_date(text)
+
+
 # ---------------------------------------------------------------------------
 # calendar command
 # ---------------------------------------------------------------------------
@@ -416,6 +437,13 @@ class TestCalendarCommand:
         assert "Phone Screen" in result.output
         assert "Technical Interview" in result.output
 
+        with _patch_db(db_path):
+            result = runner.invoke(app, ["calendar", "--limit", "1"])
+        assert result.exit_code == 0
+        assert "Coveo" in result.output
+        assert "Intact" not in result.output
+        assert "raise --limit" in result.output
+
     def test_calendar_midnight_shows_dash(self, tmp_path: Path, sample_opportunity, sample_application):
         """Events at midnight should show a dash for the time (e.g. follow-up due dates)."""
         db_path = tmp_path / "test.db"
@@ -98,7 +98,7 @@ class TestSourcesScanIntegration:
             return scored
 
         with (
-            patch("emplaiyed.cli.sources_cmd.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
             patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": _make_persisting_source(opps)}),
             patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=_fake_profile()),
             patch("emplaiyed.scoring.score_opportunities", new_callable=AsyncMock, side_effect=_score_and_verify),
@@ -121,7 +121,7 @@ class TestSourcesScanIntegration:
         scored = _fake_scored(opps)
 
         with (
-            patch("emplaiyed.cli.sources_cmd.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
             patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": _make_persisting_source(opps)}),
             patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=_fake_profile()),
             patch("emplaiyed.scoring.score_opportunities", new_callable=AsyncMock, return_value=scored),
@@ -142,7 +142,7 @@ class TestSourcesScanIntegration:
         opps = _fake_opportunities()
 
         with (
-            patch("emplaiyed.cli.sources_cmd.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
             patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": _make_persisting_source(opps)}),
             patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=None),
         ):
@@ -162,7 +162,7 @@ class TestSourcesScanIntegration:
         opps = _fake_opportunities()
 
         with (
-            patch("emplaiyed.cli.sources_cmd.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
             patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": _make_persisting_source(opps)}),
             patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=_fake_profile()),
             patch("emplaiyed.scoring.score_opportunities", new_callable=AsyncMock, side_effect=RuntimeError("LLM down")),
@@ -184,7 +184,7 @@ class TestSourcesScanIntegration:
         fake_source.scrape_and_persist = AsyncMock(return_value=[])
 
         with (
-            patch("emplaiyed.cli.sources_cmd.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
             patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": fake_source}),
             patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=_fake_profile()),
         ):
@@ -194,3 +194,75 @@ class TestSourcesScanIntegration:
 
         assert result.exit_code == 0
         assert "No new opportunities found" in result.output
+
+
+class TestSourcesSearchIntegration:
+    def test_search_scores_results(self, tmp_path: Path):
+        from emplaiyed.sources.search_agent import SearchResult
+
+        db_path = tmp_path / "test.db"
+        init_db(db_path).close()
+
+        opps = _fake_opportunities()
+        search_result = SearchResult(
+            opportunities=opps, queries_used=["python"], summary="done"
+        )
+
+        with (
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=_fake_profile()),
+            patch("emplaiyed.sources.search_agent.agentic_search", new_callable=AsyncMock, return_value=search_result),
+            patch("emplaiyed.scoring.score_opportunities", new_callable=AsyncMock, return_value=_fake_scored(opps)),
+            patch("emplaiyed.cli.sources_cmd._eager_generate_assets", return_value=0),
+        ):
+            result = runner.invoke(app, ["sources", "search"])
+
+        assert result.exit_code == 0, f"CLI failed:\n{result.output}"
+        assert "3 opportunities scored" in result.output
+
+
+class TestSourcesScanAll:
+    def test_scans_sources_concurrently_and_isolates_failures(self, tmp_path: Path):
+        db_path = tmp_path / "test.db"
+        init_db(db_path).close()
+
+        opps = _fake_opportunities()
+        good = _make_persisting_source(opps)
+        bad = MagicMock()
+        bad.name = "broken"
+        bad.scrape_and_persist = AsyncMock(side_effect=RuntimeError("HTTP 503"))
+
+        with (
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"fake": good, "broken": bad}),
+            patch("emplaiyed.cli.sources_cmd.try_load_profile", return_value=None),
+        ):
+            result = runner.invoke(
+                app, ["sources", "scan-all", "--keywords", "python", "--no-score"]
+            )
+
+        assert result.exit_code == 0, f"CLI failed:\n{result.output}"
+        assert "broken: failed" in result.output
+        assert "3 new opportunities found" in result.output
+        good.scrape_and_persist.assert_awaited_once()
+
+    def test_scan_accepts_several_sources(self, tmp_path: Path):
+        db_path = tmp_path / "test.db"
+        init_db(db_path).close()
+
+        opps = _fake_opportunities()
+        first = _make_persisting_source(opps[:2])
+        second = _make_persisting_source(opps[2:])
+
+        with (
+            patch("emplaiyed.cli.get_default_db_path", return_value=db_path),
+            patch("emplaiyed.cli.sources_cmd.get_available_sources", return_value={"a": first, "b": second, "c": MagicMock()}),
+        ):
+            result = runner.invoke(
+                app, ["sources", "scan", "-s", "a,b", "--keywords", "python", "--location", "Montreal", "--no-score"]
+            )
+
+        assert result.exit_code == 0, f"CLI failed:\n{result.output}"
+        assert "3 new opportunities found" in result.output
+        first.scrape_and_persist.assert_awaited_once()
+        second.scrape_and_persist.assert_awaited_once()
@@ -9,6 +9,7 @@ from __future__ import annotations
 import sqlite3
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -215,12 +216,48 @@ class TestQueue:
             await pilot.press("d")
             assert app.query_one("#list-queue").option_count == 2
             assert get_work_item(db, "wi-2").status == WorkStatus.COMPLETED
+            # Other tabs catch up on the deferred refresh.
+            await pilot.pause(0.2)
+            assert app.query_one("#list-applied").option_count == 1
 
             # p on next first item (Corp1, wi-1)
             await pilot.press("p")
             assert app.query_one("#list-queue").option_count == 1
             assert get_work_item(db, "wi-1").status == WorkStatus.SKIPPED
 
+    async def test_action_rebuilds_queue_once(self, db, db_path):
+        """The visible tab is rebuilt by the action, not again by the deferred pass."""
+        _seed_queue(db)
+        app = WorkConsoleApp(db_path=db_path)
+        async with app.run_test() as pilot:
+            with patch.object(app, "_refresh_queue", wraps=app._refresh_queue) as spy:
+                await pilot.press("d")
+                await pilot.pause(0.2)
+                assert spy.call_count == 1
+                assert app.query_one("#list-applied").option_count == 1
+
+    async def test_refresh_picks_up_assets_written_elsewhere(
+        self, db, db_path, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "emplaiyed.generation.pipeline._find_project_root", lambda: tmp_path
+        )
+        _seed_queue(db)
+        app = WorkConsoleApp(db_path=db_path)
+        async with app.run_test() as pilot:
+            await pilot.press("j")
+            assert "Not generated" in str(app.query_one("#detail-queue").content)
+            await pilot.press("k")
+
+            # Another process (e.g. `emplaiyed outreach`) writes Corp1's assets.
+            asset_dir = tmp_path / "data" / "assets" / "app-1"
+            (asset_dir / "cv.pdf").write_bytes(b"fake")
+            (asset_dir / "letter.pdf").write_bytes(b"fake")
+
+            # Passing Corp2 rebuilds the queue with Corp1 on top.
+            await pilot.press("p")
+            assert "Assets: Ready" in str(app.query_one("#detail-queue").content)
+
     async def test_scored_apps_in_queue(self, db, db_path):
         """SCORED apps (no work items) appear in Queue; d/p work on them."""
         now = datetime.now()
@@ -311,6 +348,8 @@ class TestTabsAndPipeline:
             assert app.query_one("#list-closed").option_count == 2
 
             await pilot.press("right")  # Funnel
+            await app.workers.wait_for_complete()  # funnel renders in a thread
+            await pilot.pause()
             text = str(app.query_one("#detail-funnel").content)
             assert "FUNNEL DASHBOARD" in text
             assert "Total:" in text
@@ -893,4 +932,7 @@ class TestEndToEnd:
 
             # Funnel: has stats
             await pilot.press("right")
+            await pilot.pause(0.2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
             assert "Closed" in str(app.query_one("#detail-funnel").content)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 
 from emplaiyed.console.funnel_stats import FunnelSnapshot, StageStats, compute_funnel
-from emplaiyed.console.stages import STAGE_GROUPS, STAGE_TAB_ORDER
+from emplaiyed.console.stages import STAGE_GROUPS, STAGE_TAB_ORDER, tab_for_status
 from emplaiyed.core.models import Application, ApplicationStatus, StatusTransition
 
 
@@ -49,6 +49,11 @@ class TestStageGroups:
         for name in STAGE_GROUPS:
             assert name in STAGE_TAB_ORDER
 
+    def test_tab_for_status(self):
+        assert tab_for_status(ApplicationStatus.BELOW_THRESHOLD) == "Queue"
+        assert tab_for_status(ApplicationStatus.FOLLOW_UP_1) == "Applied"
+        assert tab_for_status(ApplicationStatus.GHOSTED) == "Closed"
+
 
 class TestComputeFunnelEmpty:
     def test_empty_inputs(self):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from datetime import date, datetime
 from pathlib import Path
 
@@ -8,15 +9,28 @@ import pytest
 
 from emplaiyed.core.database import (
     active_opportunity_keys,
+    application_ids_with_work,
+    count_applications_by_status,
+    count_pending_work_items,
     delete_application,
     delete_event,
     get_default_db_path,
     get_application,
+    get_applications_by_id_prefix,
+    get_applications_many,
     get_event,
     get_offer,
+    get_opportunities_many,
     get_opportunity,
+    get_opportunity_for_application,
+    get_pending_work_item_for_application,
     get_work_item,
+    get_work_items_by_id_prefix,
     init_db,
+    iter_applications_with_opportunity,
+    iter_offers_with_opportunity,
+    iter_pending_work_summaries,
+    list_all_status_transitions,
     list_applications,
     list_applications_by_statuses,
     list_events,
@@ -33,6 +47,7 @@ from emplaiyed.core.database import (
     save_event,
     save_interaction,
     save_offer,
+    save_opportunities,
     save_opportunity,
     save_status_transition,
     save_work_item,
@@ -143,6 +158,23 @@ class TestInitDb:
         assert "scheduled_events" in tables
         assert "work_items" in tables
 
+    def test_connection_pragmas(self, db: sqlite3.Connection):
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert db.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_shared_connection_across_threads(self, tmp_path: Path):
+        conn = init_db(tmp_path / "test.db", check_same_thread=False)
+        result: list[int] = []
+        worker = threading.Thread(
+            target=lambda: result.append(conn.execute("SELECT 1").fetchone()[0])
+        )
+        worker.start()
+        worker.join()
+        assert result == [1]
+        conn.close()
+
     def test_idempotent_and_migrations(self, tmp_path: Path):
         """Calling init_db twice should not error; migrations add scoring columns."""
         db_path = tmp_path / "test.db"
@@ -177,6 +209,37 @@ class TestInitDb:
         conn2 = init_db(db_path)
         conn2.close()
 
+    def test_up_to_date_schema_skips_ddl(self, tmp_path: Path):
+        db_path = tmp_path / "test.db"
+        init_db(db_path).close()
+        conn = init_db(db_path)
+        conn.execute("DROP INDEX idx_work_items_application")
+        conn.commit()
+        conn.close()
+        # user_version matches, so the dropped index is not recreated...
+        conn = init_db(db_path)
+        assert not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'idx_work_items_application'"
+        ).fetchone()
+        # ...until the stored version no longer matches.
+        conn.execute("PRAGMA user_version=0")
+        conn.close()
+        conn = init_db(db_path)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'idx_work_items_application'"
+        ).fetchone()
+        conn.close()
+
+    def test_failed_migration_leaves_version_unset(self, tmp_path: Path, monkeypatch):
+        import emplaiyed.core.database as database
+
+        monkeypatch.setattr(
+            database, "_MIGRATIONS", ["ALTER TABLE missing ADD COLUMN x TEXT"]
+        )
+        conn = init_db(tmp_path / "test.db")
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        conn.close()
+
 
 # ---------------------------------------------------------------------------
 # Opportunity CRUD
@@ -211,6 +274,27 @@ class TestOpportunityCRUD:
     def test_get_nonexistent_returns_none(self, db: sqlite3.Connection):
         assert get_opportunity(db, "does-not-exist") is None
 
+    def test_get_for_application(
+        self,
+        db: sqlite3.Connection,
+        sample_opportunity: Opportunity,
+        sample_application: Application,
+    ):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        assert get_opportunity_for_application(db, "app-1").id == "opp-1"
+        assert get_opportunity_for_application(db, "missing") is None
+
+    def test_save_many(self, db: sqlite3.Connection, sample_opportunity: Opportunity):
+        opps = [
+            sample_opportunity.model_copy(update={"id": f"opp-{i}", "title": f"Role {i}"})
+            for i in range(3)
+        ]
+        save_opportunities(db, opps)
+        save_opportunities(db, opps[:1])  # re-saving keeps one FTS row per opportunity
+        assert {o.id for o in list_opportunities(db)} == {"opp-0", "opp-1", "opp-2"}
+        assert len(search_opportunities(db, "Role")) == 3
+
     def test_list_all(self, db: sqlite3.Connection):
         for i in range(3):
             opp = Opportunity(
@@ -377,6 +461,189 @@ class TestApplicationCRUD:
         assert loaded.status == ApplicationStatus.OUTREACH_SENT
 
 
+class TestCountApplicationsByStatus:
+    def test_empty(self, db):
+        assert count_applications_by_status(db) == {}
+
+    def test_groups_by_status(self, db, sample_opportunity, sample_application):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        for i, status in enumerate([ApplicationStatus.SCORED, ApplicationStatus.SCORED]):
+            save_application(
+                db,
+                sample_application.model_copy(update={"id": f"app-s{i}", "status": status}),
+            )
+        assert count_applications_by_status(db) == {"DISCOVERED": 1, "SCORED": 2}
+
+
+class TestIterApplicationsWithOpportunity:
+    def test_joins_opportunity_fields(
+        self, db, sample_opportunity, sample_application
+    ):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        rows = list(iter_applications_with_opportunity(db))
+        assert len(rows) == 1
+        row = rows[0]
+        assert row.id == "app-1"
+        assert row.status == "DISCOVERED"
+        assert row.company == "Acme Corp"
+        assert row.title == "Backend Developer"
+        assert row.updated_at == "2025-01-15T11:00:00"
+
+    def test_missing_opportunity_yields_none(self, db, sample_application):
+        db.execute("PRAGMA foreign_keys=OFF")
+        save_application(db, sample_application)
+        row = next(iter_applications_with_opportunity(db))
+        assert row.company is None
+        assert row.title is None
+
+    def test_filter_by_status(self, db, sample_opportunity, sample_application):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        scored = sample_application.model_copy(
+            update={"id": "app-2", "status": ApplicationStatus.SCORED}
+        )
+        save_application(db, scored)
+        rows = iter_applications_with_opportunity(db, status=ApplicationStatus.SCORED)
+        assert [r.id for r in rows] == ["app-2"]
+
+    def test_limit_and_offset(self, db, sample_opportunity, sample_application):
+        save_opportunity(db, sample_opportunity)
+        for i in range(5):
+            save_application(
+                db,
+                sample_application.model_copy(
+                    update={"id": f"app-{i}", "updated_at": datetime(2025, 1, 1 + i)}
+                ),
+            )
+        page = iter_applications_with_opportunity(db, limit=2, offset=2)
+        assert [r.id for r in page] == ["app-2", "app-1"]
+
+    def test_status_listing_uses_index(self, db):
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM applications "
+            "WHERE status = ? ORDER BY updated_at DESC",
+            ("SCORED",),
+        ).fetchall()
+        detail = " ".join(row[3] for row in plan)
+        assert "idx_applications_status_updated" in detail
+        assert "TEMP B-TREE" not in detail
+
+
+class TestIdPrefixLookup:
+    def _save_apps(self, db, sample_opportunity, ids):
+        save_opportunity(db, sample_opportunity)
+        for app_id in ids:
+            save_application(
+                db,
+                Application(
+                    id=app_id,
+                    opportunity_id=sample_opportunity.id,
+                    status=ApplicationStatus.DISCOVERED,
+                    created_at=datetime(2025, 1, 15, 11, 0, 0),
+                    updated_at=datetime(2025, 1, 15, 11, 0, 0),
+                ),
+            )
+
+    def test_unique_prefix(self, db, sample_opportunity):
+        self._save_apps(db, sample_opportunity, ["abc-1", "abd-1", "xyz-1"])
+        matches = get_applications_by_id_prefix(db, "abc")
+        assert [a.id for a in matches] == ["abc-1"]
+
+    def test_ambiguous_prefix_is_capped_by_limit(self, db, sample_opportunity):
+        self._save_apps(db, sample_opportunity, ["ab-1", "ab-2", "ab-3"])
+        assert len(get_applications_by_id_prefix(db, "ab")) == 2
+        assert len(get_applications_by_id_prefix(db, "ab", limit=10)) == 3
+
+    def test_no_match(self, db, sample_opportunity):
+        self._save_apps(db, sample_opportunity, ["abc-1"])
+        assert get_applications_by_id_prefix(db, "abd") == []
+
+    def test_does_not_match_neighbouring_ids(self, db, sample_opportunity):
+        # "ab" must not pick up "ac..." even though it sorts right after.
+        self._save_apps(db, sample_opportunity, ["ac-1", "aa-1"])
+        assert get_applications_by_id_prefix(db, "ab") == []
+
+    def test_work_items(self, db, sample_opportunity, sample_application):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        for wid in ["wi-aaa", "wi-aab", "wi-bbb"]:
+            save_work_item(
+                db,
+                WorkItem(
+                    id=wid,
+                    application_id="app-1",
+                    work_type=WorkType.OUTREACH,
+                    title="Item",
+                    instructions="Do it.",
+                    target_status="OUTREACH_SENT",
+                    previous_status="SCORED",
+                    created_at=datetime(2025, 2, 10, 14, 0, 0),
+                ),
+            )
+        assert [w.id for w in get_work_items_by_id_prefix(db, "wi-b")] == ["wi-bbb"]
+        assert len(get_work_items_by_id_prefix(db, "wi-aa")) == 2
+
+    @pytest.mark.parametrize("table", ["applications", "work_items"])
+    def test_prefix_range_searches_primary_key_index(self, db, table):
+        plan = db.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {table} "
+            "WHERE id >= ? AND id < ? ORDER BY id LIMIT ?",
+            ("ab", "ac", 2),
+        ).fetchall()
+        detail = " ".join(row[3] for row in plan)
+        assert detail.startswith(f"SEARCH {table} USING INDEX")
+        assert "TEMP B-TREE" not in detail
+
+
+class TestGetMany:
+    def test_applications_keyed_by_id(self, db, sample_opportunity, sample_application):
+        save_opportunity(db, sample_opportunity)
+        for app_id in ["a-1", "a-2", "a-3"]:
+            save_application(db, sample_application.model_copy(update={"id": app_id}))
+        apps = get_applications_many(db, ["a-3", "a-1", "a-1", "missing"])
+        assert sorted(apps) == ["a-1", "a-3"]
+        assert apps["a-3"].opportunity_id == sample_opportunity.id
+
+    def test_empty_ids(self, db):
+        assert get_applications_many(db, []) == {}
+
+    def test_opportunities_chunked(self, db, sample_opportunity, monkeypatch):
+        monkeypatch.setattr("emplaiyed.core.database._IN_CHUNK", 2)
+        ids = [f"opp-{i}" for i in range(5)]
+        for opp_id in ids:
+            save_opportunity(db, sample_opportunity.model_copy(update={"id": opp_id}))
+        opps = get_opportunities_many(db, ids)
+        assert sorted(opps) == ids
+
+
+class TestApplicationIdsWithWork:
+    def test_returns_only_candidates_with_items(
+        self, db, sample_opportunity, sample_application
+    ):
+        save_opportunity(db, sample_opportunity)
+        for app_id in ["app-1", "app-2"]:
+            save_application(db, sample_application.model_copy(update={"id": app_id}))
+        for wid in ["wi-1", "wi-2"]:
+            save_work_item(
+                db,
+                WorkItem(
+                    id=wid,
+                    application_id="app-1",
+                    work_type=WorkType.OUTREACH,
+                    title="Item",
+                    instructions="Do it.",
+                    target_status="OUTREACH_SENT",
+                    previous_status="SCORED",
+                    created_at=datetime(2025, 2, 10, 14, 0, 0),
+                ),
+            )
+        assert application_ids_with_work(db, ["app-1", "app-2"]) == {"app-1"}
+        assert application_ids_with_work(db, ["app-2"]) == set()
+        assert application_ids_with_work(db, []) == set()
+
+
 class TestDeleteApplication:
     """Tests for cascading application deletion."""
 
@@ -613,6 +880,30 @@ class TestOfferCRUD:
         accepted = list_offers(db, status=OfferStatus.ACCEPTED)
         assert len(accepted) == 1
 
+    def test_iter_with_opportunity(
+        self,
+        db: sqlite3.Connection,
+        sample_opportunity: Opportunity,
+        sample_application: Application,
+        sample_offer: Offer,
+    ):
+        save_opportunity(db, sample_opportunity)
+        save_application(db, sample_application)
+        save_offer(db, sample_offer)
+        save_offer(
+            db,
+            Offer(
+                id="off-2",
+                application_id="app-1",
+                status=OfferStatus.DECLINED,
+                created_at=datetime(2025, 2, 11, 9, 0, 0),
+            ),
+        )
+        rows = list(iter_offers_with_opportunity(db))
+        assert [r.status for r in rows] == ["DECLINED", "PENDING"]
+        assert rows[0].salary is None and rows[0].deadline is None
+        assert rows[1] == (95000, "2025-02-20", "PENDING", "Acme Corp", "Backend Developer")
+
     def test_upsert_updates_status(
         self,
         db: sqlite3.Connection,
@@ -872,6 +1163,7 @@ class TestScheduledEventCRUD:
             < upcoming[1].scheduled_date
             < upcoming[2].scheduled_date
         )
+        assert [e.id for e in list_upcoming_events(db, limit=2)] == ["evt-2097", "evt-2098"]
 
     def test_delete_event(
         self,
@@ -1051,6 +1343,11 @@ class TestWorkItemCRUD:
         pending = list_pending_work_items(db)
         assert len(pending) == 1
         assert pending[0].id == "wi-0"
+        assert count_pending_work_items(db) == 1
+        summaries = list(iter_pending_work_summaries(db))
+        assert [(w.id, w.title) for w in summaries] == [("wi-0", "Item 0")]
+        assert get_pending_work_item_for_application(db, "app-1").id == "wi-0"
+        assert get_pending_work_item_for_application(db, "missing") is None
 
     def test_upsert_updates_status(
         self,
@@ -1170,6 +1467,7 @@ class TestStatusHistoryCRUD:
         assert len(result) == 3
         assert result[0].to_status == "SCORED"
         assert result[2].to_status == "OUTREACH_SENT"
+        assert list_all_status_transitions(db) == result
 
 
 class TestListApplicationsByStatuses:
@@ -1513,6 +1811,9 @@ class TestDefaultDbPath:
         assert p.name == "emplaiyed.db"
         assert p.parent.name == "data"
 
+    def test_is_memoized(self):
+        assert get_default_db_path() is get_default_db_path()
+
 
 # ---------------------------------------------------------------------------
 # Full-text search
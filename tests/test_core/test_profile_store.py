@@ -182,3 +182,6 @@ class TestDefaultPath:
         p = get_default_profile_path()
         assert p.name == "profile.yaml"
         assert p.parent.name == "data"
+
+    def test_is_memoized(self):
+        assert get_default_profile_path() is get_default_profile_path()
@@ -0,0 +1,57 @@
+"""Unit tests for emplaiyed.llm.cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from emplaiyed.llm.cache import cache_key, cached_call
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class TestCacheKey:
+    def test_stable_for_equal_inputs(self, sample_opportunity):
+        assert cache_key("prep", sample_opportunity) == cache_key(
+            "prep", sample_opportunity.model_copy()
+        )
+
+    def test_changes_with_op_and_inputs(self, sample_opportunity):
+        edited = sample_opportunity.model_copy(update={"title": "Staff Engineer"})
+        key = cache_key("prep", sample_opportunity)
+        assert key != cache_key("negotiate", sample_opportunity)
+        assert key != cache_key("prep", edited)
+
+
+class TestCachedCall:
+    async def test_second_call_is_served_from_disk(self, tmp_path: Path):
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            return Answer(text=f"call {calls}")
+
+        first = await cached_call("k", Answer, fn, cache_dir=tmp_path)
+        second = await cached_call("k", Answer, fn, cache_dir=tmp_path)
+        assert first == second == Answer(text="call 1")
+        assert calls == 1
+
+    async def test_refresh_regenerates_and_overwrites(self, tmp_path: Path):
+        async def fn():
+            return Answer(text="fresh")
+
+        (tmp_path / "k.json").write_text('{"text": "stale"}')
+        assert (await cached_call("k", Answer, fn, cache_dir=tmp_path)).text == "stale"
+        assert (await cached_call("k", Answer, fn, refresh=True, cache_dir=tmp_path)).text == "fresh"
+        assert (await cached_call("k", Answer, fn, cache_dir=tmp_path)).text == "fresh"
+
+    async def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        async def fn():
+            return Answer(text="fresh")
+
+        (tmp_path / "k.json").write_text("{not json")
+        assert (await cached_call("k", Answer, fn, cache_dir=tmp_path)).text == "fresh"
@@ -144,3 +144,13 @@ class TestScrapeAndPersist:
         source = MockSource([])
         saved = await source.scrape_and_persist(SearchQuery(), db_conn)
         assert saved == []
+
+
+class TestGetAvailableSources:
+    def test_reuses_instances_across_calls(self):
+        from emplaiyed.sources import get_available_sources
+
+        first = get_available_sources()
+        second = get_available_sources()
+        assert first is not second  # callers get their own dict...
+        assert all(first[name] is second[name] for name in first)  # ...of shared sources
@@ -39,6 +39,24 @@ class TestSourcesList:
         assert result.exit_code == 0
         assert "ready" in result.output
 
+    def test_list_does_not_scrape(self):
+        from emplaiyed.sources.base import BaseSource
+
+        class StubSource(BaseSource):
+            implemented = False
+            name = "stubby"
+
+            async def scrape(self, query):
+                raise AssertionError("sources list must not scrape")
+
+        with patch(
+            "emplaiyed.cli.sources_cmd.get_available_sources",
+            return_value={"stubby": StubSource()},
+        ):
+            result = runner.invoke(app, ["sources", "list"])
+        assert result.exit_code == 0
+        assert "stub" in result.output
+
 
 class TestSourcesScan:
     def test_scan_unknown_source(self):
@@ -92,6 +110,16 @@ class TestScanProfileDerived:
         assert result.exit_code == 0
         assert "Derived keywords from profile" in result.output
 
+    def test_derived_keywords_are_deduplicated(self):
+        from emplaiyed.cli.sources_cmd import _derive_from_profile
+
+        profile = _mock_profile(
+            skills=["python", " Docker ", ""],
+            aspirations=Aspirations(target_roles=["Python", "Docker"]),
+        )
+        kw_list, _ = _derive_from_profile(profile, "Montreal")
+        assert kw_list == ["Python", "Docker"]
+
     def test_derives_location_from_profile(self):
         """When --location omitted, derive from geographic_preferences (skip Remote)."""
         profile = _mock_profile()
@@ -136,3 +164,51 @@ class TestScanProfileDerived:
             )
         assert result.exit_code == 0
         assert "Toronto" in result.output
+
+    def test_explicit_args_and_no_score_skip_profile_load(self):
+        with patch("emplaiyed.cli.sources_cmd.try_load_profile") as mock_load:
+            result = runner.invoke(
+                app,
+                [
+                    "sources", "scan", "--source", "manual",
+                    "--keywords", "python", "--location", "Toronto", "--no-score",
+                ],
+            )
+        assert result.exit_code == 0
+        mock_load.assert_not_called()
+
+    def test_explicit_args_without_profile_file_skip_profile_load(self, tmp_path):
+        with patch(
+            "emplaiyed.cli.sources_cmd.get_default_profile_path",
+            return_value=tmp_path / "profile.yaml",
+        ), patch("emplaiyed.cli.sources_cmd.try_load_profile") as mock_load:
+            result = runner.invoke(
+                app,
+                [
+                    "sources", "scan", "--source", "manual",
+                    "--keywords", "python", "--location", "Toronto",
+                ],
+            )
+        assert result.exit_code == 0
+        mock_load.assert_not_called()
+
+    def test_score_with_no_profile_is_rejected(self):
+        result = runner.invoke(
+            app,
+            [
+                "sources", "scan", "--source", "manual",
+                "--keywords", "python", "--no-profile", "--score",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "--no-profile" in result.output
+
+    def test_no_profile_skips_derivation_and_scoring(self):
+        with patch("emplaiyed.cli.sources_cmd.try_load_profile") as mock_load:
+            result = runner.invoke(
+                app,
+                ["sources", "scan", "--source", "manual", "--keywords", "python", "--no-profile"],
+            )
+        assert result.exit_code == 0
+        mock_load.assert_not_called()
+        assert "Derived location" not in result.output
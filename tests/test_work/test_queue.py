@@ -5,6 +5,7 @@ from __future__ import annotations
 import sqlite3
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -107,6 +108,24 @@ class TestCreateWorkItem:
         assert loaded.instructions == "Instructions here."
         assert loaded.draft_content is None
 
+    def test_failure_rolls_back_transition(self, db, scored_app):
+        with patch(
+            "emplaiyed.work.queue.save_work_item", side_effect=sqlite3.OperationalError
+        ), pytest.raises(sqlite3.OperationalError):
+            create_work_item(
+                db,
+                application_id="app-1",
+                work_type=WorkType.OUTREACH,
+                title="Test item",
+                instructions="Instructions here.",
+                target_status=ApplicationStatus.OUTREACH_SENT,
+                previous_status=ApplicationStatus.SCORED,
+                pending_status=ApplicationStatus.OUTREACH_PENDING,
+            )
+
+        assert get_application(db, "app-1").status == ApplicationStatus.SCORED
+        assert list_pending_work_items(db) == []
+
 
 class TestCompleteWorkItem:
     def test_completes_and_advances_state(self, db, scored_app):